@@ -1,10 +1,54 @@
 """Variables used by the test modules
 """
+import atexit
 import logging
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 import os
+import queue
+import sys
 import tempfile
 
-_LOG_DIR = tempfile.gettempdir()
-_LOG_DIR = '/tmp'
-_LOG_FILENAME = _LOG_DIR + os.sep + 'xlogger.log'
-_LOG_LEVEL = logging.DEBUG
+# Set XMATTERS_LOG to send the test log somewhere other than the temp dir.
+_LOG_FILENAME = (os.environ.get('XMATTERS_LOG') or
+                 os.path.join(tempfile.gettempdir(), 'xlogger.log'))
+# Parallel runs (pytest -n) get one log file per worker so the workers'
+# buffered writes never interleave in a shared file.
+_LOG_WORKER = os.environ.get('PYTEST_XDIST_WORKER')
+if _LOG_WORKER:
+    _LOG_ROOT, _LOG_EXT = os.path.splitext(_LOG_FILENAME)
+    _LOG_FILENAME = '%s.%s%s' % (_LOG_ROOT, _LOG_WORKER, _LOG_EXT)
+# Set XMATTERS_LOG_LEVEL (e.g. WARNING) to quiet the debug output.
+_LOG_LEVEL = os.environ.get('XMATTERS_LOG_LEVEL') or logging.DEBUG
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that opens its stream with a large write buffer
+
+    emit() still flushes after every record, so an abnormal exit never
+    leaves records sitting in the buffer.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=64 * 1024,
+                    encoding=self.encoding)
+
+# The test thread only puts records on the queue, the listener thread does
+# the stdout and file writes. The log file is not opened until a record
+# actually reaches it.
+_LOG_QUEUE = queue.Queue(-1)
+_LOG_LISTENER = QueueListener(
+    _LOG_QUEUE,
+    logging.StreamHandler(sys.stdout),
+    _BufferedFileHandler(_LOG_FILENAME, delay=True))
+
+XLOGGER = logging.getLogger('xlogger')
+XLOGGER.setLevel(_LOG_LEVEL)
+# The queue already feeds stdout and the log file; don't hand every record
+# to the root logger's handlers (pytest's capture handlers) a second time.
+XLOGGER.propagate = False
+# Importing this module a second time (say under another package name) must
+# not stack a second handler and listener on the shared logger.
+if not XLOGGER.handlers:
+    XLOGGER.addHandler(QueueHandler(_LOG_QUEUE))
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
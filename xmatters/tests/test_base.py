@@ -5,22 +5,14 @@
 
 import json
 import logging
-import sys
+import pickle
 import unittest
 
 from xmatters import XmattersBase
 from xmatters import XmattersJSONEncoder
 from xmatters import XmattersList
 
-from tests import _LOG_FILENAME
-from tests import _LOG_LEVEL
-
 XLOGGER = logging.getLogger('xlogger')
-XLOGGER.level = _LOG_LEVEL
-XSTREAM_HANDLER = logging.StreamHandler(sys.stdout)
-XLOGGER.addHandler(XSTREAM_HANDLER)
-XFILE_HANDLER = logging.FileHandler(_LOG_FILENAME)
-XLOGGER.addHandler(XFILE_HANDLER)
 
 # pylint: disable=missing-docstring, invalid-name, no-member
 
@@ -46,8 +38,46 @@ class ErrorTest(XmattersBase):
     """
 
     _arg_names = _attr_names = _json_names = ['code', 'reason', 'message']
-    _attr_types = [int, str, str]
+    _attr_types = (int, str, str)
+
 
+class XmattersBaseTest(unittest.TestCase):
+    """Collection of unit tests cases for the XmattersBase class
+    """
+
+    def test_class_dicts(self):
+        XLOGGER.debug("XmattersBaseTest.test_class_dicts: Start")
+
+        class FreshTest(XmattersBase):
+            _arg_names = ['id', '*self_link']
+            _attr_names = ['id', 'self']
+            _json_names = ['id', 'self']
+            _attr_types = (str, str)
+
+        # Built when the class is defined, before any instance exists
+        self.assertEqual(getattr(FreshTest, '__arg_dict'),
+                         {'id': 'id', 'self_link': 'self'})
+        self.assertEqual(getattr(FreshTest, '__req_args_dict'),
+                         {'id': True, 'self_link': False})
+        self.assertEqual(getattr(FreshTest, '__json_dict'),
+                         {'id': 'id', 'self': 'self'})
+        XLOGGER.debug("XmattersBaseTest.test_class_dicts: Success")
+
+    def test_too_many_positional_args(self):
+        XLOGGER.debug("XmattersBaseTest.test_too_many_positional_args: Start")
+        self.assertRaises(
+            TypeError, ErrorTest, 404, "Not Found", "Could not find", "extra")
+        XLOGGER.debug(
+            "XmattersBaseTest.test_too_many_positional_args: Success")
+
+    def test_pickle(self):
+        XLOGGER.debug("XmattersBaseTest.test_pickle: Start")
+        err = ErrorTest(404, "Not Found", "Could not find a person")
+        obj = pickle.loads(pickle.dumps(err))
+        self.assertIsInstance(obj, ErrorTest)
+        self.assertEqual(obj, err)
+        self.assertEqual(obj.json, err.json)
+        XLOGGER.debug("XmattersBaseTest.test_pickle: Success")
 
 class XmattersListTest(unittest.TestCase):
     """Collection of unit tests cases for the Error class
@@ -62,60 +92,73 @@ class XmattersListTest(unittest.TestCase):
     class BadTestList2(XmattersList):
         base_class = object
 
-    def setUp(self):
-        XLOGGER.info("XLOGGER.info XmattersListTest.setUp")
-        self.err = []
-        self.err.append(ErrorTest(
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.info("XLOGGER.info XmattersListTest.setUpClass")
+        cls.err = []
+        cls.err.append(ErrorTest(
             404, "Not Found",
             "Could not find a person with id 0313142d3-4703-a90e-36cc5f5f6209"))
-        self.err.append(ErrorTest(
+        cls.err.append(ErrorTest(
             200, "OK",
             "Found a person with id 0313142d3-4703-a90e-36cc5f5f6209"))
-        self.err.append(ErrorTest(
+        cls.err.append(ErrorTest(
             202, "Submitted",
             "Submitted search for person id 0313142d3-4703-a90e-36cc5f5f6209"))
-        self.err_json_str = []
-        self.err_json = []
-        self.err_json_str.append((
-            '{"code":%d,"reason":"%s","message":"%s"}')%(
-            404, "Not Found",
-            "Could not find a person with id 0313142d3-4703-a90e-36cc5f5f6209"))
-        self.err_json.append(ErrorTest.from_json_str(self.err_json_str[0]))
-        self.err_json_str.append((
-            '{"code":%d,"reason":"%s","message":"%s"}')%(
-            200, "OK",
-            "Found a person with id 0313142d3-4703-a90e-36cc5f5f6209"))
-        self.err_json.append(ErrorTest.from_json_str(self.err_json_str[1]))
-        self.err_json_str.append((
-            '{"code":%d,"reason":"%s","message":"%s"}')%(
-            202, "Submitted",
-            "Submitted search for person id 0313142d3-4703-a90e-36cc5f5f6209"))
-        self.err_json.append(ErrorTest.from_json_str(self.err_json_str[2]))
-        self.err_json_str1 = '[%s]'%(','.join(self.err_json_str))
+        raw = [
+            {"code": 404, "reason": "Not Found", "message": (
+                "Could not find a person with id "
+                "0313142d3-4703-a90e-36cc5f5f6209")},
+            {"code": 200, "reason": "OK", "message": (
+                "Found a person with id 0313142d3-4703-a90e-36cc5f5f6209")},
+            {"code": 202, "reason": "Submitted", "message": (
+                "Submitted search for person id "
+                "0313142d3-4703-a90e-36cc5f5f6209")}]
+        cls.err_json_str = [
+            json.dumps(err, separators=(',', ':')) for err in raw]
+        cls.err_json_str1 = json.dumps(raw, separators=(',', ':'))
 
     def tearDown(self):
         XLOGGER.debug("XmattersListTest.tearDown")
 
+    def test_ErrorTest_from_json_str(self):
+        XLOGGER.debug("XmattersListTest.test_ErrorTest_from_json_str: Start")
+        for tl in range(3):
+            obj = ErrorTest.from_json_str(self.err_json_str[tl])
+            self.assertIsInstance(obj, ErrorTest)
+            self.assertEqual(obj, self.err[tl])
+        XLOGGER.debug("XmattersListTest.test_ErrorTest_from_json_str: Success")
+
+    def test_ErrorTest_eq(self):
+        XLOGGER.debug("XmattersListTest.test_ErrorTest_eq: Start")
+        err = self.err[0]
+        self.assertEqual(err, ErrorTest(err.code, err.reason, err.message))
+        self.assertNotEqual(err, ErrorTest(err.code, err.reason, "other"))
+        self.assertNotEqual(err, self.err[1])
+        XLOGGER.debug("XmattersListTest.test_ErrorTest_eq: Success")
+
     def test_TestList(self):
         XLOGGER.debug("XmattersListTest.test_TestList: Start")
         tlobj = XmattersListTest.TestList.from_json_str(self.err_json_str1)
         self.assertIsInstance(tlobj, XmattersListTest.TestList)
-        self.assertEqual(len(tlobj), 3)
+        # One list comparison covers the length and every element
+        self.assertListEqual(tlobj, self.err)
         for tl in range(3):
-            self.assertIsInstance(tlobj[tl], ErrorTest)
+            tlobj_tl = tlobj[tl]
+            self.assertIsInstance(tlobj_tl, ErrorTest)
             XLOGGER.debug(
                 "test_TestList: tlobj[%d]=%s, Equality is %s",
-                tl, str(tlobj[tl]), (tlobj[tl] == self.err[tl]))
-            self.assertEqual(tlobj[tl], self.err[tl])
+                tl, tlobj_tl, tlobj_tl == self.err[tl])
+            tlobj_json = tlobj_tl.json
             XLOGGER.debug(
-                "test_TestList: tlobj[%d].json: %s",
-                tl, tlobj[tl].json)
-            self.assertEqual(tlobj[tl].json, self.err_json_str[tl])
+                "test_TestList: tlobj[%d].json: %s", tl, tlobj_json)
+            self.assertEqual(tlobj_json, self.err_json_str[tl])
             XLOGGER.debug(
                 "test_TestList: json.dumps(tlobj[%d]): %s",
                 tl,
                 json.dumps(
-                    tlobj[tl], separators=(',', ':'), cls=XmattersJSONEncoder))
+                    tlobj_tl, separators=(',', ':'),
+                    cls=XmattersJSONEncoder))
         self.assertRaises(
             TypeError, XmattersListTest.BadTestList1.from_json_str,
             self.err_json_str1)
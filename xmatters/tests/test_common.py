@@ -5,7 +5,6 @@
 
 import json
 import logging
-import sys
 import unittest
 
 from xmatters import Error
@@ -15,91 +14,85 @@ from xmatters import ReferenceById
 from xmatters import ReferenceByIdAndSelfLink
 from xmatters import SelfLink
 
-from tests import _LOG_FILENAME
-from tests import _LOG_LEVEL
-
 XLOGGER = logging.getLogger('xlogger')
-XLOGGER.level = _LOG_LEVEL
-XSTREAM_HANDLER = logging.StreamHandler(sys.stdout)
-XLOGGER.addHandler(XSTREAM_HANDLER)
-XFILE_HANDLER = logging.FileHandler(_LOG_FILENAME)
-XLOGGER.addHandler(XFILE_HANDLER)
 
 class ErrorTest(unittest.TestCase):
     """Collection of unit tests cases for the Error class
     """
 
-    def setUp(self):
-        XLOGGER.info("XLOGGER.info ErrorTest.setUp")
-        self.code = 404
-        self.reason = "Not Found"
-        self.message = (
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.info("XLOGGER.info ErrorTest.setUpClass")
+        cls.code = 404
+        cls.reason = "Not Found"
+        cls.message = (
             "Could not find a person with id 0313142d3-4703-a90e-36cc5f5f6209")
-        self.err_json_str = (
-            '{"code":%d,"reason":"%s","message":"%s"}')%(
-            self.code, self.reason, self.message)
+        cls.err_json_str = (
+            f'{{"code":{cls.code},"reason":"{cls.reason}",'
+            f'"message":"{cls.message}"}}')
+        cls.err_json_obj = json.loads(cls.err_json_str)
+        cls.err = Error(cls.code, cls.reason, cls.message)
 
     def tearDown(self):
         XLOGGER.debug("ErrorTest.tearDown")
 
     def test_Error(self):
         XLOGGER.debug("ErrorTest.test_Error: Start")
-        obj1 = Error(self.code, self.reason, self.message)
+        code, reason, message = self.code, self.reason, self.message
+        obj1 = Error(code, reason, message)
         self.assertIsInstance(obj1, Error)
-        self.assertEqual(obj1.code, self.code)
-        self.assertEqual(obj1.reason, self.reason)
-        self.assertEqual(obj1.message, self.message)
-        self.assertRaises(
-            TypeError, Error, self.message, self.code, self.reason)
-        self.assertRaises(TypeError, Error, self.code, self.reason)
-        obj2 = Error(
-            code=self.code, reason=self.reason, message=self.message)
+        self.assertEqual(obj1.code, code)
+        self.assertEqual(obj1.reason, reason)
+        self.assertEqual(obj1.message, message)
+        with self.assertRaises(TypeError):
+            Error(message, code, reason)
+        with self.assertRaises(TypeError):
+            Error(code, reason)
+        obj2 = Error(code=code, reason=reason, message=message)
         self.assertIsInstance(obj2, Error)
-        self.assertEqual(obj2.code, self.code)
-        self.assertEqual(obj2.reason, self.reason)
-        self.assertEqual(obj2.message, self.message)
-        self.assertRaises(TypeError, Error,
-                reason=self.code, code=self.reason, message=self.message)
-        self.assertRaises(TypeError, Error,
-                code=self.code, message=self.message)
+        self.assertEqual(obj2.code, code)
+        self.assertEqual(obj2.reason, reason)
+        self.assertEqual(obj2.message, message)
+        with self.assertRaises(TypeError):
+            Error(reason=code, code=reason, message=message)
+        with self.assertRaises(TypeError):
+            Error(code=code, message=message)
         self.assertEqual(obj1, obj2)
         XLOGGER.debug("ErrorTest.test_Error: Success")
 
     def test_Error_from_json_obj(self):
         XLOGGER.debug("ErrorTest.test_Error_from_json_obj: Start")
-        json_obj = json.loads(self.err_json_str)
-        obj = Error.from_json_obj(json_obj)
+        obj = Error.from_json_obj(self.err_json_obj)
         self.assertIsInstance(obj, Error)
-        obj1 = Error(self.code, self.reason, self.message)
-        self.assertEqual(obj, obj1)
+        self.assertEqual(obj, self.err)
         XLOGGER.debug("ErrorTest.test_Error_from_json_obj: Success")
 
     def test_Error_from_json_str(self):
         XLOGGER.debug("ErrorTest.test_Error_from_json_str: Start")
         obj = Error.from_json_str(self.err_json_str)
         self.assertIsInstance(obj, Error)
-        obj1 = Error(self.code, self.reason, self.message)
-        self.assertEqual(obj, obj1)
+        self.assertEqual(obj, self.err)
         XLOGGER.debug("ErrorTest.test_Error_from_json_str: Success")
 
 class PaginationLinksTest(unittest.TestCase):
     """Collection of unit tests cases for the PaginationLinks class
     """
 
-    def setUp(self):
-        XLOGGER.debug("PaginationLinksTest.setUp")
-        self.self = "/api/xm/1/people?offset=100&limit=100"
-        self.previous = "/api/xm/1/people?offset=0&limit=100"
-        self.next = "/api/xm/1/people?offset=200&limit=100"
-        self.links_json_str = (
-            '{"self": "%s", "previous": "%s", "next": "%s" }'
-            )%(self.self, self.previous, self.next)
-        self.min_links_json_str = (
-            '{"self": "%s"}'
-            )%(self.self)
-        self.bad_links_json_str = (
-            '{"next": "%s", "previous": "%s" }'
-            )%(self.next, self.previous)
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("PaginationLinksTest.setUpClass")
+        cls.self = "/api/xm/1/people?offset=100&limit=100"
+        cls.previous = "/api/xm/1/people?offset=0&limit=100"
+        cls.next = "/api/xm/1/people?offset=200&limit=100"
+        cls.links_json_str = (
+            f'{{"self": "{cls.self}", "previous": "{cls.previous}", '
+            f'"next": "{cls.next}" }}')
+        cls.links_json_obj = json.loads(cls.links_json_str)
+        cls.pagination_links = PaginationLinks(
+            cls.self, cls.previous, cls.next)
+        cls.min_links_json_str = f'{{"self": "{cls.self}"}}'
+        cls.bad_links_json_str = (
+            f'{{"next": "{cls.next}", "previous": "{cls.previous}" }}')
 
     def tearDown(self):
         XLOGGER.debug("PaginationLinksTest.tearDown")
@@ -122,18 +115,18 @@ class PaginationLinksTest(unittest.TestCase):
         self.assertEqual(obj3.self, self.self)
         self.assertIsNone(obj3.previous)
         self.assertIsNone(obj3.next)
-        self.assertRaises(TypeError, PaginationLinks, 1)
-        self.assertRaises(TypeError, PaginationLinks, 0, self.previous)
+        with self.assertRaises(TypeError):
+            PaginationLinks(1)
+        with self.assertRaises(TypeError):
+            PaginationLinks(0, self.previous)
         XLOGGER.debug("PaginationLinksTest.test_PaginationLinks Success")
 
     def test_PaginationLinks_from_json_obj(self):
         XLOGGER.debug(
             "PaginationLinksTest.test_PaginationLinks_from_json_obj: Start")
-        json_obj = json.loads(self.links_json_str)
-        obj = PaginationLinks.from_json_obj(json_obj)
+        obj = PaginationLinks.from_json_obj(self.links_json_obj)
         self.assertIsInstance(obj, PaginationLinks)
-        obj1 = PaginationLinks(self.self, self.previous, self.next)
-        self.assertEqual(obj, obj1)
+        self.assertEqual(obj, self.pagination_links)
         XLOGGER.debug(
             "PaginationLinksTest.test_PaginationLinks_from_json_obj: Success")
 
@@ -142,9 +135,9 @@ class PaginationLinksTest(unittest.TestCase):
             "PaginationLinksTest.test_PaginationLinks_from_json_str: Start")
         obj = PaginationLinks.from_json_str(self.links_json_str)
         self.assertIsInstance(obj, PaginationLinks)
-        self.assertRaises(TypeError, PaginationLinks.from_json_str, self.bad_links_json_str)
-        obj1 = PaginationLinks(self.self, self.previous, self.next)
-        self.assertEqual(obj, obj1)
+        with self.assertRaises(TypeError):
+            PaginationLinks.from_json_str(self.bad_links_json_str)
+        self.assertEqual(obj, self.pagination_links)
         XLOGGER.debug(
             "PaginationLinksTest.test_PaginationLinks_from_json_str: Success")
 
@@ -153,43 +146,31 @@ class PaginationTest(unittest.TestCase):
     """Collection of unit tests cases for the Pagination class
     """
 
-    def setUp(self):
-        XLOGGER.debug("PaginationTest.setUp")
-        self.count = 100
-        self.total = 235
-        self.data_id1 = "8f2d98ed-eaa9-4b0b-b366-c1db06b27e1f"
-        self.data_id2 = "8f2d98ed-eaa9-4b0b-b366-c1db06b27e1f"
-        self.data = [{"id": self.data_id1},{"id": self.data_id2}]
-        self.self = "/api/xm/1/people?offset=0&limit=100"
-        self.previous = None
-        self.next = "/api/xm/1/people?offset=100&limit=100"
-        self.links_json_str = (
-            '{"self": "%s", "next": "%s"}'
-            )%(self.self, self.next)
-        self.links = PaginationLinks.from_json_str('%s'%self.links_json_str)
-        self.pagi_json_str = (
-            '{"count": %d, "total": %d, '
-            '"data": [{"id": "%s"},{"id": "%s"}], '
-            '"links": %s}'
-            )%(self.count, self.total, self.data_id1,
-               self.data_id2, self.links_json_str)
-        self.bad_json1 = (
-            '{"count": %d}'
-            )%(self.count)
-        self.bad_json2 = (
-            '{"count": %d, "total": %d}'
-            )%(self.count, self.total)
-        self.bad_json3 = (
-            '{"count": %d, "total": %d, '
-            '"data": [{"id": "%s"},{"id": "%s"}]}'
-            )%(self.count, self.total, self.data_id1,
-               self.data_id2)
-        self.bad_json4 = (
-            '{"data": %d, "links": %d, '
-            '"count": [{"id": "%s"},{"id": "%s"}], '
-            '"total": %s}'
-            )%(self.count, self.total, self.data_id1,
-               self.data_id2, self.links_json_str)
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("PaginationTest.setUpClass")
+        cls.count = 100
+        cls.total = 235
+        cls.data_id1 = "8f2d98ed-eaa9-4b0b-b366-c1db06b27e1f"
+        cls.data_id2 = "8f2d98ed-eaa9-4b0b-b366-c1db06b27e1f"
+        cls.data = [{"id": cls.data_id1},{"id": cls.data_id2}]
+        cls.self = "/api/xm/1/people?offset=0&limit=100"
+        cls.previous = None
+        cls.next = "/api/xm/1/people?offset=100&limit=100"
+        links = {"self": cls.self, "next": cls.next}
+        cls.links_json_str = json.dumps(links)
+        cls.links = PaginationLinks.from_json_str(cls.links_json_str)
+        cls.pagi_json_str = json.dumps({
+            "count": cls.count, "total": cls.total,
+            "data": cls.data, "links": links})
+        cls.pagi_json_obj = json.loads(cls.pagi_json_str)
+        cls.pagination = Pagination(cls.count, cls.data, cls.links, cls.total)
+        cls.bad_jsons = tuple(json.dumps(bad) for bad in (
+            {"count": cls.count},
+            {"count": cls.count, "total": cls.total},
+            {"count": cls.count, "total": cls.total, "data": cls.data},
+            {"data": cls.count, "links": cls.total,
+             "count": cls.data, "total": links}))
 
     def tearDown(self):
         XLOGGER.debug("PaginationTest.tearDown")
@@ -199,55 +180,60 @@ class PaginationTest(unittest.TestCase):
         obj = Pagination(self.count, self.data, self.links, self.total)
         self.assertIsInstance(obj, Pagination)
         self.assertEqual(obj.count, self.count)
-        self.assertEqual(obj.data, self.data)
+        self.assertListEqual(obj.data, self.data)
         self.assertIsInstance(obj.links, PaginationLinks)
         self.assertEqual(obj.links, self.links)
         self.assertEqual(obj.total, self.total)
-        self.assertRaises(TypeError, Pagination, self.count)
-        self.assertRaises(TypeError, Pagination, self.count, self.data)
-        self.assertRaises(TypeError, Pagination, self.count, self.data,
-                          self.links)
-        self.assertRaises(TypeError, Pagination, 'not an int', self.data,
-                          self.links, self.total)
-        self.assertRaises(TypeError, Pagination, self.count, 'not an object',
-                          self.links, self.total)
-        self.assertRaises(TypeError, Pagination, self.count, self.data,
-                          'not a list', self.total)
-        self.assertRaises(TypeError, Pagination, self.count, self.data,
-                          self.links, 'not an int')
         XLOGGER.debug("PaginationTest.test_Pagination: Success")
 
+    def test_Pagination_TypeError(self):
+        XLOGGER.debug("PaginationTest.test_Pagination_TypeError: Start")
+        bad_args = (
+            (self.count,),
+            (self.count, self.data),
+            (self.count, self.data, self.links),
+            ('not an int', self.data, self.links, self.total),
+            (self.count, 'not an object', self.links, self.total),
+            (self.count, self.data, 'not a list', self.total),
+            (self.count, self.data, self.links, 'not an int'),
+        )
+        for args in bad_args:
+            with self.subTest(args=args):
+                with self.assertRaises(TypeError):
+                    Pagination(*args)
+        XLOGGER.debug("PaginationTest.test_Pagination_TypeError: Success")
+
     def test_Pagination_from_json_obj(self):
         XLOGGER.debug("PaginationTest.test_Pagination_from_json_obj: Start")
-        json_obj = json.loads(self.pagi_json_str)
-        obj = Pagination.from_json_obj(json_obj)
+        obj = Pagination.from_json_obj(self.pagi_json_obj)
         self.assertIsInstance(obj, Pagination)
-        obj1 = Pagination(self.count, self.data, self.links, self.total)
-        self.assertEqual(obj, obj1)
+        self.assertEqual(obj, self.pagination)
         XLOGGER.debug("PaginationTest.test_Pagination_from_json_obj: Success")
 
     def test_Pagination_from_json_str(self):
         XLOGGER.debug("PaginationTest.test_Pagination_from_json_str: Start")
         obj = Pagination.from_json_str(self.pagi_json_str)
         self.assertIsInstance(obj, Pagination)
-        obj1 = Pagination(self.count, self.data, self.links, self.total)
-        self.assertEqual(obj, obj1)
-        self.assertRaises(TypeError, Pagination.from_json_str, self.bad_json1)
-        self.assertRaises(TypeError, Pagination.from_json_str, self.bad_json2)
-        self.assertRaises(TypeError, Pagination.from_json_str, self.bad_json3)
-        self.assertRaises(TypeError, Pagination.from_json_str, self.bad_json4)
+        self.assertEqual(obj, self.pagination)
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    Pagination.from_json_str(bad_json)
         XLOGGER.debug("PaginationTest.test_Pagination_from_json_str: Success")
 
 class SelfLinkTest(unittest.TestCase):
     """Collection of unit tests cases for the SelfLink class
     """
 
-    def setUp(self):
-        XLOGGER.debug("SelfLinkTest.setUp")
-        self.self = "/api/xm/1/people/84a6dde7-82ad-4e64-9f4d-3b9001ad60de"
-        self.self_json_str = ('{"self": "%s"}')%(self.self)
-        self.bad_json1 = '{"self": 0}'
-        self.bad_json2 = '{}'
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("SelfLinkTest.setUpClass")
+        cls.self = "/api/xm/1/people/84a6dde7-82ad-4e64-9f4d-3b9001ad60de"
+        cls.self_json_str = f'{{"self": "{cls.self}"}}'
+        cls.self_json_obj = json.loads(cls.self_json_str)
+        cls.self_link = SelfLink(cls.self)
+        cls.bad_json1 = '{"self": 0}'
+        cls.bad_json2 = '{}'
 
     def tearDown(self):
         XLOGGER.debug("SelfLinkTest.tearDown")
@@ -257,37 +243,49 @@ class SelfLinkTest(unittest.TestCase):
         obj = SelfLink(self.self)
         self.assertIsInstance(obj, SelfLink)
         self.assertEqual(obj.self, self.self)
-        self.assertRaises(TypeError, SelfLink)
-        self.assertRaises(TypeError, SelfLink, 0)
+        with self.assertRaises(TypeError):
+            SelfLink()
+        with self.assertRaises(TypeError):
+            SelfLink(0)
         XLOGGER.debug("test_SelfLink Successful")
 
-    def test_SelfLink_from_json_obj(self):
-        XLOGGER.debug("SelfLinkTest.test_SelfLink_from_json_obj: Start")
-        json_obj = json.loads(self.self_json_str)
-        obj = SelfLink.from_json_obj(json_obj)
-        self.assertIsInstance(obj, SelfLink)
-        self.assertEqual(obj.self, self.self)
-        XLOGGER.debug("SelfLinkTest.test_SelfLink_from_json_obj: Success")
+    def test_SelfLink_all_paths(self):
+        XLOGGER.debug("SelfLinkTest.test_SelfLink_all_paths: Start")
+        factories = (
+            ("ctor", lambda: SelfLink(self.self)),
+            ("from_json_obj",
+             lambda: SelfLink.from_json_obj(self.self_json_obj)),
+            ("from_json_str",
+             lambda: SelfLink.from_json_str(self.self_json_str)),
+        )
+        for kind, factory in factories:
+            with self.subTest(kind=kind):
+                obj = factory()
+                self.assertIsInstance(obj, SelfLink)
+                self.assertEqual(obj, self.self_link)
+        XLOGGER.debug("SelfLinkTest.test_SelfLink_all_paths: Success")
 
     def test_SelfLink_from_json_str(self):
         XLOGGER.debug("SelfLinkTest.test_SelfLink_from_json_str: Start")
-        obj = SelfLink.from_json_str(self.self_json_str)
-        self.assertIsInstance(obj, SelfLink)
-        self.assertEqual(obj.self, self.self)
-        self.assertRaises(TypeError, SelfLink.from_json_str, self.bad_json1)
-        self.assertRaises(TypeError, SelfLink.from_json_str, self.bad_json2)
+        with self.assertRaises(TypeError):
+            SelfLink.from_json_str(self.bad_json1)
+        with self.assertRaises(TypeError):
+            SelfLink.from_json_str(self.bad_json2)
         XLOGGER.debug("SelfLinkTest.test_SelfLink_from_json_str: Success")
 
 class ReferenceByIdTest(unittest.TestCase):
     """Collection of unit tests cases for the ReferenceById class
     """
 
-    def setUp(self):
-        XLOGGER.debug("ReferenceByIdTest.setUp")
-        self.id = "/api/xm/1/people/84a6dde7-82ad-4e64-9f4d-3b9001ad60de"
-        self.id_json_str = ('{"id": "%s"}')%(self.id)
-        self.bad_json_str1 = '{"id": 0}'
-        self.bad_json_str2 = "{}"
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("ReferenceByIdTest.setUpClass")
+        cls.id = "/api/xm/1/people/84a6dde7-82ad-4e64-9f4d-3b9001ad60de"
+        cls.id_json_str = f'{{"id": "{cls.id}"}}'
+        cls.id_json_obj = json.loads(cls.id_json_str)
+        cls.ref = ReferenceById(cls.id)
+        cls.bad_json_str1 = '{"id": 0}'
+        cls.bad_json_str2 = "{}"
 
     def tearDown(self):
         XLOGGER.debug("ReferenceByIdTest.tearDown")
@@ -297,61 +295,61 @@ class ReferenceByIdTest(unittest.TestCase):
         obj = ReferenceById(self.id)
         self.assertIsInstance(obj, ReferenceById)
         self.assertEqual(obj.id, self.id)
-        self.assertRaises(TypeError, ReferenceById)
-        self.assertRaises(TypeError, ReferenceById, 0)
+        with self.assertRaises(TypeError):
+            ReferenceById()
+        with self.assertRaises(TypeError):
+            ReferenceById(0)
         XLOGGER.debug("ReferenceByIdTest.test_ReferenceById: Success")
 
-    def test_ReferenceById_from_json_obj(self):
+    def test_ReferenceById_all_paths(self):
         XLOGGER.debug(
-            "ReferenceByIdTest.test_ReferenceById_from_json_obj: Start")
-        json_obj = json.loads(self.id_json_str)
-        obj = ReferenceById.from_json_obj(json_obj)
-        self.assertIsInstance(obj, ReferenceById)
-        obj1 = ReferenceById(self.id)
-        self.assertEqual(obj, obj1)
+            "ReferenceByIdTest.test_ReferenceById_all_paths: Start")
+        factories = (
+            ("ctor", lambda: ReferenceById(self.id)),
+            ("from_json_obj",
+             lambda: ReferenceById.from_json_obj(self.id_json_obj)),
+            ("from_json_str",
+             lambda: ReferenceById.from_json_str(self.id_json_str)),
+        )
+        for kind, factory in factories:
+            with self.subTest(kind=kind):
+                obj = factory()
+                self.assertIsInstance(obj, ReferenceById)
+                self.assertEqual(obj, self.ref)
         XLOGGER.debug(
-            "ReferenceByIdTest.test_ReferenceById_from_json_obj: Success")
+            "ReferenceByIdTest.test_ReferenceById_all_paths: Success")
 
     def test_ReferenceById_from_json_str(self):
         XLOGGER.debug(
             "ReferenceByIdTest.test_ReferenceById_from_json_str: Start")
-        obj = ReferenceById.from_json_str(self.id_json_str)
-        self.assertIsInstance(obj, ReferenceById)
-        obj1 = ReferenceById(self.id)
-        self.assertEqual(obj, obj1)
-        self.assertRaises(
-            TypeError, ReferenceById.from_json_str, self.bad_json_str1)
-        self.assertRaises(
-            TypeError, ReferenceById.from_json_str, self.bad_json_str2)
+        with self.assertRaises(TypeError):
+            ReferenceById.from_json_str(self.bad_json_str1)
+        with self.assertRaises(TypeError):
+            ReferenceById.from_json_str(self.bad_json_str2)
         XLOGGER.debug(
             "ReferenceByIdTest.test_ReferenceById_from_json_str: Success")
 
 class ReferenceByIdAndSelfLinkTest(unittest.TestCase):
     """Collection of unit tests cases for the ReferenceByIdAndSelfLink class
     """
-    def setUp(self):
-        XLOGGER.debug("ReferenceByIdAndSelfLinkTest.setUp")
-        self.id = "f0c572a8-45ec-fe23-289c-df749cf19a5e"
-        self.self = "/api/xm/1/sites/f0c572a8-45ec-fe23-289c-df749cf19a5e"
-        self.previous = None
-        self.next = None
-        self.links_json_str = ('{"self": "%s"}')%(self.self)
-        self.links =SelfLink.from_json_str(self.links_json_str)
-        self.id_json_str = (
-            '{"id": "%s", "links": %s}'
-            )%(self.id, self.links_json_str)
-        self.bad_json_str1 = (
-            '{"id": "%s"}'
-            )%(self.id)
-        self.bad_json_str2 = (
-            '{"links": %s}'
-            )%(self.links_json_str)
-        self.bad_json_str3 = (
-            '{"id": 0, "links": %s}'
-            )%(self.links_json_str)
-        self.bad_json_str4 = (
-            '{"id": "%s", "links": 0}'
-            )%(self.id)
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("ReferenceByIdAndSelfLinkTest.setUpClass")
+        cls.id = "f0c572a8-45ec-fe23-289c-df749cf19a5e"
+        cls.self = "/api/xm/1/sites/f0c572a8-45ec-fe23-289c-df749cf19a5e"
+        cls.previous = None
+        cls.next = None
+        cls.links_json_str = f'{{"self": "{cls.self}"}}'
+        cls.links = SelfLink.from_json_str(cls.links_json_str)
+        cls.id_json_str = (
+            f'{{"id": "{cls.id}", "links": {cls.links_json_str}}}')
+        cls.id_json_obj = json.loads(cls.id_json_str)
+        cls.ref = ReferenceByIdAndSelfLink(cls.id, cls.links)
+        cls.bad_json_strs = (
+            f'{{"id": "{cls.id}"}}',
+            f'{{"links": {cls.links_json_str}}}',
+            f'{{"id": 0, "links": {cls.links_json_str}}}',
+            f'{{"id": "{cls.id}", "links": 0}}')
 
     def tearDown(self):
         XLOGGER.debug("ReferenceByIdAndSelfLinkTest.tearDown")
@@ -364,45 +362,46 @@ class ReferenceByIdAndSelfLinkTest(unittest.TestCase):
         self.assertEqual(obj.id, self.id)
         self.assertIsInstance(obj.links, SelfLink)
         self.assertEqual(obj.links, self.links)
-        self.assertRaises(TypeError, ReferenceByIdAndSelfLink, self.id)
-        self.assertRaises(TypeError, ReferenceByIdAndSelfLink, 0,  self.links)
-        self.assertRaises(TypeError, ReferenceByIdAndSelfLink, self.id, 0)
+        with self.assertRaises(TypeError):
+            ReferenceByIdAndSelfLink(self.id)
+        with self.assertRaises(TypeError):
+            ReferenceByIdAndSelfLink(0, self.links)
+        with self.assertRaises(TypeError):
+            ReferenceByIdAndSelfLink(self.id, 0)
         XLOGGER.debug(
             "ReferenceByIdAndSelfLinkTest.test_ReferenceByIdAndSelfLink: Succe")
 
-    def test_ReferenceByIdAndSelfLink_from_json_obj(self):
+    def test_ReferenceByIdAndSelfLink_all_paths(self):
         XLOGGER.debug(
             "ReferenceByIdAndSelfLinkTest."
-            "test_ReferenceByIdAndSelfLink_from_json_obj: Start")
-        json_obj = json.loads(self.id_json_str)
-        obj = ReferenceByIdAndSelfLink.from_json_obj(json_obj)
-        self.assertIsInstance(obj, ReferenceByIdAndSelfLink)
-        obj1 = ReferenceByIdAndSelfLink(self.id, self.links)
-        self.assertEqual(obj, obj1)
+            "test_ReferenceByIdAndSelfLink_all_paths: Start")
+        factories = (
+            ("ctor", lambda: ReferenceByIdAndSelfLink(self.id, self.links)),
+            ("from_json_obj",
+             lambda: ReferenceByIdAndSelfLink.from_json_obj(self.id_json_obj)),
+            ("from_json_str",
+             lambda: ReferenceByIdAndSelfLink.from_json_str(self.id_json_str)),
+        )
+        for kind, factory in factories:
+            with self.subTest(kind=kind):
+                obj = factory()
+                self.assertIsInstance(obj, ReferenceByIdAndSelfLink)
+                self.assertEqual(obj, self.ref)
         XLOGGER.debug(
             "ReferenceByIdAndSelfLinkTest."
-            "test_ReferenceByIdAndSelfLink_from_json_obj: Success")
+            "test_ReferenceByIdAndSelfLink_all_paths: Success")
 
     def test_ReferenceByIdAndSelfLink_from_json_str(self):
         XLOGGER.debug(
             "ReferenceByIdAndSelfLinkTest."
             "test_ReferenceByIdAndSelfLink_from_json_str: Start")
-        obj = ReferenceByIdAndSelfLink.from_json_str(self.id_json_str)
-        self.assertIsInstance(obj, ReferenceByIdAndSelfLink)
-        obj1 = ReferenceByIdAndSelfLink(self.id, self.links)
-        self.assertEqual(obj, obj1)
-        self.assertRaises(TypeError, ReferenceByIdAndSelfLink.from_json_str,
-            self.bad_json_str1)
-        self.assertRaises(TypeError, ReferenceByIdAndSelfLink.from_json_str,
-            self.bad_json_str2)
-        self.assertRaises(TypeError, ReferenceByIdAndSelfLink.from_json_str,
-            self.bad_json_str3)
-        self.assertRaises(TypeError, ReferenceByIdAndSelfLink.from_json_str,
-            self.bad_json_str4)
+        for bad_json in self.bad_json_strs:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    ReferenceByIdAndSelfLink.from_json_str(bad_json)
         XLOGGER.debug(
             "ReferenceByIdAndSelfLinkTest."
             "test_ReferenceByIdAndSelfLink_from_json_str: Success")
 
 if __name__ == "__main__":
-    sys.argv = ['', 'XmattersListTest.test_TestList']
     unittest.main()
@@ -5,32 +5,16 @@
 
 import json
 import logging
-import sys
 import unittest
 
 from xmatters import Conference
 from xmatters import ConferenceHostType
 from xmatters import Event
-from xmatters import EventPriority
-from xmatters import EventStatus
-from xmatters import FormReference
-from xmatters import RecipientList
-from xmatters import RecipientPagination
 from xmatters import ResponseAction
 from xmatters import ResponseContribution
 from xmatters import ResponseOption
-from xmatters import ResponseOptionList
-from xmatters import ResponseOptionPagination
-
-from tests import _LOG_FILENAME
-from tests import _LOG_LEVEL
 
 XLOGGER = logging.getLogger('xlogger')
-XLOGGER.level = _LOG_LEVEL
-XSTREAM_HANDLER = logging.StreamHandler(sys.stdout)
-XLOGGER.addHandler(XSTREAM_HANDLER)
-XFILE_HANDLER = logging.FileHandler(_LOG_FILENAME)
-XLOGGER.addHandler(XFILE_HANDLER)
 
 # pylint: disable=missing-docstring, invalid-name, no-member
 # pylint: disable=too-many-instance-attributes, too-many-lines
@@ -39,16 +23,18 @@ class ConferenceTest(unittest.TestCase):
     """Collection of unit tests cases for the Conference class
     """
 
-    def setUp(self):
-        XLOGGER.debug("ConferenceTest.setUp")
-        self.bridge_id = "67955226"
-        self.type = ConferenceHostType.BRIDGE
-        self.json_str = ('{"bridgeId":"%s","type":"%s"}'
-            )%(self.bridge_id, self.type.value)
-        self.bad_json1 = ('{"bridgeId":"%s"}')%(self.bridge_id)
-        self.bad_json2 = ('{"type":"%s"}')%(self.type.value)
-        self.bad_json3 = ('{"bridgeId":%d,"type":"%s"}')%(0, self.type.value)
-        self.bad_json4 = ('{"bridgeId":"%s","type":%d}')%(self.bridge_id, 0,)
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("ConferenceTest.setUpClass")
+        cls.bridge_id = "67955226"
+        cls.type = ConferenceHostType.BRIDGE
+        base = {"bridgeId": cls.bridge_id, "type": cls.type.value}
+        cls.json_str = json.dumps(base)
+        cls.bad_jsons = tuple(json.dumps(bad) for bad in (
+            {"bridgeId": base["bridgeId"]},
+            {"type": base["type"]},
+            dict(base, bridgeId=0),
+            dict(base, type=0)))
 
     def tearDown(self):
         XLOGGER.debug("ConferenceTest.tearDown")
@@ -59,10 +45,10 @@ class ConferenceTest(unittest.TestCase):
         self.assertIsInstance(obj, Conference)
         self.assertEqual(obj.bridge_id, self.bridge_id)
         self.assertEqual(obj.type, self.type)
-        self.assertRaises(TypeError, Conference, "")
-        self.assertRaises(TypeError, Conference, "", "")
-        self.assertRaises(TypeError, Conference, 0, "")
-        self.assertRaises(TypeError, Conference, "", 0)
+        for args in (("",), ("", ""), (0, ""), ("", 0)):
+            with self.subTest(args=args):
+                with self.assertRaises(TypeError):
+                    Conference(*args)
         XLOGGER.debug("test_class: Success")
 
     def test_from_json_obj(self):
@@ -80,10 +66,10 @@ class ConferenceTest(unittest.TestCase):
         self.assertIsInstance(obj, Conference)
         obj1 = Conference(self.bridge_id, self.type)
         self.assertEqual(obj, obj1)
-        self.assertRaises(TypeError, Conference.from_json_str, self.bad_json1)
-        self.assertRaises(TypeError, Conference.from_json_str, self.bad_json2)
-        self.assertRaises(TypeError, Conference.from_json_str, self.bad_json3)
-        self.assertRaises(TypeError, Conference.from_json_str, self.bad_json4)
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    Conference.from_json_str(bad_json)
         XLOGGER.debug(
             "test_from_json_str: Success")
 
@@ -91,9 +77,10 @@ class ResponseOptionTest(unittest.TestCase):
     """Collection of unit tests cases for the ResponseOption class
     """
 
-    def setUp(self):
-        XLOGGER.debug("ResponseOptionTest.setUp")
-        self.test_data = (
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("ResponseOptionTest.setUpClass")
+        cls.test_data = (
             '{'
             '"text":"Reject",'
             '"description":"Reject",'
@@ -103,146 +90,29 @@ class ResponseOptionTest(unittest.TestCase):
             '"action":"STOP_NOTIFYING_USER",'
             '"contribution":"NONE"'
             '}')
-        self.number = 2
-        self.text = "Reject"
-        self.description = "Reject"
-        self.prompt = "I cannot assist"
-        self.action = ResponseAction.STOP_NOTIFYING_USER
-        self.contribution = ResponseContribution.NONE
-        self.join_conference = False
-        self.json_str = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.description, self.prompt,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json1 = (
-            '{'
-            '"text":"%s","description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.text, self.description, self.prompt,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json2 = (
-            '{'
-            '"number":%d,"description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.description, self.prompt,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json3 = (
-            '{'
-            '"number":%d,"text":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.prompt,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json4 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.description,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json5 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":"%s",'
-            '"contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.description, self.prompt,
-            self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json6 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":"%s",'
-            '"action":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.description, self.prompt,
-            self.action.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json7 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s"'
-            '}')%(
-            self.number, self.text, self.description, self.prompt,
-            self.action.value, self.contribution.value
-            )
-        self.bad_json8 = (
-            '{'
-            '"number":"0","text":"%s","description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.text, self.description, self.prompt,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json9 = (
-            '{'
-            '"number":%d,"text":0,"description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.description, self.prompt,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json10 = (
-            '{'
-            '"number":%d,"text":"%s","description":0,"prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.prompt,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json11 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":0,'
-            '"action":"%s","contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.description,
-            self.action.value, self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json12 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":"%s",'
-            '"action":0,"contribution":"%s","joinConference":%s'
-            '}')%(
-            self.number, self.text, self.description, self.prompt,
-            self.contribution.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json13 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":0,"joinConference":%s'
-            '}')%(
-            self.number, self.text, self.description, self.prompt,
-            self.action.value,
-            str(self.join_conference).lower()
-            )
-        self.bad_json14 = (
-            '{'
-            '"number":%d,"text":"%s","description":"%s","prompt":"%s",'
-            '"action":"%s","contribution":"%s","joinConference":"0"'
-            '}')%(
-            self.number, self.text, self.description, self.prompt,
-            self.action.value, self.contribution.value
-            )
+        cls.number = 2
+        cls.text = "Reject"
+        cls.description = "Reject"
+        cls.prompt = "I cannot assist"
+        cls.action = ResponseAction.STOP_NOTIFYING_USER
+        cls.contribution = ResponseContribution.NONE
+        cls.join_conference = False
+        base = {
+            "number": cls.number, "text": cls.text,
+            "description": cls.description, "prompt": cls.prompt,
+            "action": cls.action.value,
+            "contribution": cls.contribution.value,
+            "joinConference": cls.join_conference}
+        cls.json_str = json.dumps(base)
+        # Each required key missing, then each key with the wrong type
+        bad_values = (
+            ("number", "0"), ("text", 0), ("description", 0), ("prompt", 0),
+            ("action", 0), ("contribution", 0), ("joinConference", "0"))
+        cls.bad_jsons = tuple(
+            json.dumps({k: v for k, v in base.items() if k != key})
+            for key, _ in bad_values) + tuple(
+                json.dumps(dict(base, **{key: value}))
+                for key, value in bad_values)
 
     def tearDown(self):
         XLOGGER.debug("ResponseOptionTest.tearDown")
@@ -260,43 +130,27 @@ class ResponseOptionTest(unittest.TestCase):
         self.assertEqual(obj.action, self.action)
         self.assertEqual(obj.contribution, self.contribution)
         self.assertEqual(obj.join_conference, self.join_conference)
-        self.assertRaises(TypeError, ResponseOption, "")
-        self.assertRaises(TypeError, ResponseOption, "", "")
-        self.assertRaises(TypeError, ResponseOption, "", "", "")
-        self.assertRaises(TypeError, ResponseOption, "", "", "", 0)
-        self.assertRaises(
-            TypeError, ResponseOption, "", "", "", 0, False)
-        self.assertRaises(
-            TypeError, ResponseOption, "", "", "", 0, False,
-            ResponseAction.STOP_NOTIFYING_USER)
-        self.assertRaises(
-            TypeError, ResponseOption, 0, "", "", 0, False,
-            ResponseAction.STOP_NOTIFYING_USER,
-            ResponseContribution.NONE)
-        self.assertRaises(
-            TypeError, ResponseOption, "", 0, "", 0, False,
-            ResponseAction.STOP_NOTIFYING_USER,
-            ResponseContribution.NONE)
-        self.assertRaises(
-            TypeError, ResponseOption, "", "", 0, 0, False,
-            ResponseAction.STOP_NOTIFYING_USER,
-            ResponseContribution.NONE)
-        self.assertRaises(
-            TypeError, ResponseOption, "", "", "", "", False,
-            ResponseAction.STOP_NOTIFYING_USER,
-            ResponseContribution.NONE)
-        self.assertRaises(
-            TypeError, ResponseOption, "", "", "", 0, "",
-            ResponseAction.STOP_NOTIFYING_USER,
-            ResponseContribution.NONE)
-        self.assertRaises(
-            TypeError, ResponseOption, "", "", "", 0, False,
-            0,
-            ResponseContribution.NONE)
-        self.assertRaises(
-            TypeError, ResponseOption, "", "", "", 0, False,
-            ResponseAction.STOP_NOTIFYING_USER,
-            0)
+        stop = ResponseAction.STOP_NOTIFYING_USER
+        none = ResponseContribution.NONE
+        bad_args = (
+            ("",),
+            ("", ""),
+            ("", "", ""),
+            ("", "", "", 0),
+            ("", "", "", 0, False),
+            ("", "", "", 0, False, stop),
+            (0, "", "", 0, False, stop, none),
+            ("", 0, "", 0, False, stop, none),
+            ("", "", 0, 0, False, stop, none),
+            ("", "", "", "", False, stop, none),
+            ("", "", "", 0, "", stop, none),
+            ("", "", "", 0, False, 0, none),
+            ("", "", "", 0, False, stop, 0),
+        )
+        for args in bad_args:
+            with self.subTest(args=args):
+                with self.assertRaises(TypeError):
+                    ResponseOption(*args)
         XLOGGER.debug("test_class: Success")
 
     def test_from_json_obj(self):
@@ -318,36 +172,13 @@ class ResponseOptionTest(unittest.TestCase):
         self.assertEqual(obj, obj1)
         jstr = obj.json
         XLOGGER.debug("test_from_json_str:  obj.json: %s", jstr)
-        XLOGGER.debug("test_from_json_str: test_data: %s", self.test_data)
+        XLOGGER.debug(
+            "test_from_json_str: test_data: %s", self.test_data)
         self.assertEqual(jstr, self.test_data)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json1)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json2)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json3)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json4)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json5)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json6)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json7)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json8)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json9)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json10)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json11)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json12)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json13)
-        self.assertRaises(
-            TypeError, ResponseOption.from_json_str, self.bad_json14)
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    ResponseOption.from_json_str(bad_json)
         XLOGGER.debug(
             "test_from_json_str: Success")
 
@@ -355,9 +186,10 @@ class EventTest(unittest.TestCase):
     """Collection of unit tests cases for the Event class
     """
 
-    def setUp(self):
-        XLOGGER.debug("Event.setUp")
-        self.test_data = (
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("Event.setUpClass")
+        cls.test_data = (
             '{'
             '"bypassPhoneIntro":false,'
             '"created":"2017-03-05T11:58:20.579+0000",'
@@ -428,7 +260,7 @@ class EventTest(unittest.TestCase):
         XLOGGER.debug("test_from_json_str: jstr: %s", jstr)
         obj2 = Event.from_json_str(jstr)
         self.assertIsInstance(obj2, Event)
-        assert obj == obj2
+        self.assertEqual(obj, obj2)
 
 
 if __name__ == "__main__":
@@ -3,9 +3,9 @@
 """Unit tests for xmatters.recipients.
 """
 
+import collections
 import json
 import logging
-import sys
 import unittest
 
 from xmatters import DynamicTeam
@@ -20,111 +20,132 @@ from xmatters import RolePagination
 from xmatters import Person
 from xmatters import SelfLink
 
-from . import _LOG_FILENAME
-from . import _LOG_LEVEL
-
 XLOGGER = logging.getLogger('xlogger')
-XLOGGER.level = _LOG_LEVEL
-XSTREAM_HANDLER = logging.StreamHandler(sys.stdout)
-XLOGGER.addHandler(XSTREAM_HANDLER)
-XFILE_HANDLER = logging.FileHandler(_LOG_FILENAME)
-XLOGGER.addHandler(XFILE_HANDLER)
 
 # pylint: disable=missing-docstring, invalid-name, no-member
 # pylint: disable=too-many-instance-attributes, too-many-lines
 
+# Fixture values shared by the recipient test classes. Each class takes its
+# own list copy of the locked fields, since the constructors expect a list.
+_LOCKED = ("externallyOwned", "externalKey")
+_STATUS = RecipientStatus.ACTIVE
+# Self link shared by the Recipient and DynamicTeam fixtures
+_SELF = "/api/xm/1/people/9407eb2e-8eb2-43d9-88a8-875237af941d"
+_LINKS = SelfLink(_SELF)
+
+# Full positional constructor arguments, named after the attributes they set
+_RecipientArgs = collections.namedtuple('_RecipientArgs', (
+    'id', 'target_name', 'recipient_type', 'externally_owned',
+    'external_key', 'locked', 'status', 'links'))
+_DynamicTeamArgs = collections.namedtuple('_DynamicTeamArgs', (
+    'id', 'target_name', 'recipient_type', 'externally_owned',
+    'use_emergency_device', 'external_key', 'locked', 'status', 'links'))
+_GroupArgs = collections.namedtuple('_GroupArgs', (
+    'id', 'target_name', 'recipient_type', 'externally_owned',
+    'allow_duplicates', 'description', 'observed_by_all',
+    'use_default_devices', 'site', 'external_key', 'locked', 'status',
+    'links'))
+_PersonArgs = collections.namedtuple('_PersonArgs', (
+    'id', 'target_name', 'recipient_type', 'externally_owned', 'first_name',
+    'last_name', 'language', 'timezone', 'web_login', 'site', 'phone_login',
+    'properties', 'roles', 'external_key', 'locked', 'status', 'links'))
+
+def _without(dictionary, key):
+    """Returns a copy of dictionary with key removed."""
+    return {k: v for k, v in dictionary.items() if k != key}
+
+class _RecipientAssertions:
+    """Checks of the fields every Recipient subclass shares
+
+    Mixed into the TestCase classes below, ahead of unittest.TestCase.
+    """
+
+    def _assert_recipient(self, obj, args):
+        """Asserts obj's Recipient fields match the namedtuple args"""
+        self.assertEqual(obj.id, args.id)
+        self.assertEqual(obj.target_name, args.target_name)
+        self.assertIsInstance(obj.recipient_type, RecipientType)
+        self.assertEqual(obj.recipient_type, args.recipient_type)
+        self.assertEqual(obj.recipient_type.value, args.recipient_type.value)
+        self.assertEqual(obj.externally_owned, args.externally_owned)
+        self.assertEqual(obj.external_key, args.external_key)
+        self.assertListEqual(obj.locked, args.locked)
+        self.assertIsInstance(obj.status, RecipientStatus)
+        self.assertEqual(obj.status, args.status)
+        self.assertEqual(obj.status.value, args.status.value)
+        self.assertIsInstance(obj.links, SelfLink)
+        self.assertEqual(obj.links, args.links)
+
 class RecipientPointerTest(unittest.TestCase):
     """Collection of unit tests cases for the RecipientPointer class
     """
 
-    def setUp(self):
-        XLOGGER.debug("RecipientPointerTest.setUp")
-        self.id_p = "438e9245-b32d-445f-916bd3e07932c892"
-        self.recipient_type_p = "PERSON"
-        self.rp_p_json_str = (
-            '{"id": "%s", "recipientType": "%s"}'
-            )%(self.id_p, self.recipient_type_p)
-        self.bad_json_str1 = (
-            '{"recipientType": "%s"}'
-            )%(self.recipient_type_p)
-        self.bad_json_str2 = (
-            '{"id": %d, "recipientType": "%s"}'
-            )%(0, self.recipient_type_p)
-
-    def tearDown(self):
-        XLOGGER.debug("RecipientPointerTest.tearDown")
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("RecipientPointerTest.setUpClass")
+        dumps = json.dumps
+        cls.id_p = "438e9245-b32d-445f-916bd3e07932c892"
+        cls.recipient_type_p = "PERSON"
+        # The recipient types documented for a RecipientPointer
+        cls.recipient_types = ("PERSON", "GROUP", "DEVICE")
+        cls.rp_p_dict = {
+            "id": cls.id_p, "recipientType": cls.recipient_type_p}
+        cls.rp_p_json_str = dumps(cls.rp_p_dict)
+        cls.rp_p_json_obj = json.loads(cls.rp_p_json_str)
+        cls.bad_jsons = (
+            dumps(_without(cls.rp_p_dict, "id")),
+            dumps(dict(cls.rp_p_dict, id=0)))
 
     def test_RecipientPointer(self):
-        XLOGGER.debug("RecipientPointerTest.test_RecipientPointer: Start")
-        obj = RecipientPointer(self.id_p, self.recipient_type_p)
-        self.assertIsInstance(obj, RecipientPointer)
-        self.assertEqual(obj.id, self.id_p)
-        self.assertEqual(obj.recipient_type, self.recipient_type_p)
+        for recipient_type in self.recipient_types:
+            with self.subTest(recipient_type=recipient_type):
+                obj = RecipientPointer(self.id_p, recipient_type)
+                self.assertIsInstance(obj, RecipientPointer)
+                self.assertEqual(obj.id, self.id_p)
+                self.assertEqual(obj.recipient_type, recipient_type)
         self.assertRaises(TypeError, RecipientPointer, 0)
         self.assertRaises(TypeError, RecipientPointer, self.recipient_type_p, 0)
-        XLOGGER.debug("RecipientPointerTest.test_RecipientPointer: Success")
 
     def test_RecipientPointer_from_json_obj(self):
-        XLOGGER.debug(
-            "RecipientPointerTest.test_RecipientPointer_from_json_obj: Start")
-        json_obj = json.loads(self.rp_p_json_str)
-        obj = RecipientPointer.from_json_obj(json_obj)
+        obj = RecipientPointer.from_json_obj(self.rp_p_json_obj)
         self.assertIsInstance(obj, RecipientPointer)
         obj1 = RecipientPointer(self.id_p, self.recipient_type_p)
         self.assertEqual(obj, obj1)
-        XLOGGER.debug(
-            "RecipientPointerTest.test_RecipientPointer_from_json_obj: Success")
 
     def test_RecipientPointer_from_json_str(self):
-        XLOGGER.debug(
-            "RecipientPointerTest.test_RecipientPointer_from_json_str: Start")
         obj = RecipientPointer.from_json_str(self.rp_p_json_str)
         self.assertIsInstance(obj, RecipientPointer)
         obj1 = RecipientPointer(self.id_p, self.recipient_type_p)
         self.assertEqual(obj, obj1)
-        self.assertRaises(TypeError, RecipientPointer.from_json_str, self.bad_json_str1)
-        self.assertRaises(TypeError, RecipientPointer.from_json_str, self.bad_json_str2)
-        XLOGGER.debug(
-            "RecipientPointerTest.test_RecipientPointer_from_json_str: Success")
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    RecipientPointer.from_json_str(bad_json)
 
 class PersonReferenceTest(unittest.TestCase):
     """Collection of unit tests cases for the PersonReference class
     """
 
-    def setUp(self):
-        XLOGGER.debug("PersonReferenceTest.setUp")
-        self.id = "481086d8-357a-4279-b7d5-d7dce48fcd12"
-        self.target_name = "mmcbride"
-        self.self = "/api/xm/1/people/481086d8-357a-4279-b7d5-d7dce48fcd12"
-        self.links_json_str = ('{"self": "%s"}')%(self.self)
-        self.links =SelfLink.from_json_str(self.links_json_str)
-        self.pr_json_str = (
-            '{"id": "%s", "targetName": "%s", "links": %s}'
-            )%(self.id, self.target_name, self.links_json_str)
-        self.bad_json_str1 = (
-            '{"id": "%s", "targetName": "%s"}'
-            )%(self.id, self.target_name)
-        self.bad_json_str2 = (
-            '{"id": "%s", "links": %s}'
-            )%(self.id, self.links_json_str)
-        self.bad_json_str3 = (
-            '{"targetName": "%s", "links": %s}'
-            )%(self.target_name, self.links_json_str)
-        self.bad_json_str4 = (
-            '{"id": %d, "targetName": "%s", "links": %s}'
-            )%(0, self.target_name, self.links_json_str)
-        self.bad_json_str5 = (
-            '{"id": "%s", "targetName": %d, "links": %s}'
-            )%(self.id, 0, self.links_json_str)
-        self.bad_json_str6 = (
-            '{"id": "%s", "targetName": "%s", "links": %d}'
-            )%(self.id, self.target_name, 0)
-
-    def tearDown(self):
-        XLOGGER.debug("PersonReferenceTest.tearDown")
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("PersonReferenceTest.setUpClass")
+        dumps = json.dumps
+        cls.id = "481086d8-357a-4279-b7d5-d7dce48fcd12"
+        cls.target_name = "mmcbride"
+        cls.self = "/api/xm/1/people/481086d8-357a-4279-b7d5-d7dce48fcd12"
+        links = {"self": cls.self}
+        cls.links = SelfLink(cls.self)
+        cls.pr_dict = {
+            "id": cls.id, "targetName": cls.target_name, "links": links}
+        cls.pr_json_str = dumps(cls.pr_dict)
+        cls.pr_json_obj = json.loads(cls.pr_json_str)
+        # Each key missing, then each key with the wrong type
+        keys = ("links", "targetName", "id")
+        cls.bad_jsons = tuple(
+            dumps(_without(cls.pr_dict, key)) for key in keys) + tuple(
+                dumps(dict(cls.pr_dict, **{key: 0})) for key in keys)
 
     def test_PersonReference(self):
-        XLOGGER.debug("PersonReferenceTest.test_PersonReference: Start")
         obj = PersonReference(self.id, self.target_name, self.links)
         self.assertIsInstance(obj, PersonReference)
         self.assertEqual(obj.id, self.id)
@@ -136,223 +157,115 @@ class PersonReferenceTest(unittest.TestCase):
         self.assertRaises(TypeError, PersonReference, 0, self.target_name, self.links)
         self.assertRaises(TypeError, PersonReference, self.id, 0, self.links)
         self.assertRaises(TypeError, PersonReference, self.id, self.target_name, 0)
-        XLOGGER.debug(
-            "PersonReferenceTest.test_PersonReference: Success")
 
     def test_PersonReference_from_json_obj(self):
-        XLOGGER.debug(
-            "PersonReferenceTest.test_PersonReference_from_json_obj: Start")
-        json_obj = json.loads(self.pr_json_str)
-        obj = PersonReference.from_json_obj(json_obj)
+        obj = PersonReference.from_json_obj(self.pr_json_obj)
         self.assertIsInstance(obj, PersonReference)
         self.assertEqual(obj.id, self.id)
         self.assertEqual(obj.target_name, self.target_name)
         self.assertIsInstance(obj.links, SelfLink)
         self.assertEqual(obj.links.self, self.links.self)
-        XLOGGER.debug(
-            "PersonReferenceTest.test_PersonReference_from_json_obj: Success")
 
     def test_PersonReference_from_json_str(self):
-        XLOGGER.debug(
-            "PersonReferenceTest.test_PersonReference_from_json_str: Start")
         obj = PersonReference.from_json_str(self.pr_json_str)
         self.assertIsInstance(obj, PersonReference)
         self.assertEqual(obj.id, self.id)
         self.assertEqual(obj.target_name, self.target_name)
         self.assertIsInstance(obj.links, SelfLink)
         self.assertEqual(obj.links.self, self.links.self)
-        self.assertRaises(TypeError, PersonReference.from_json_str,
-            self.bad_json_str1)
-        self.assertRaises(TypeError, PersonReference.from_json_str,
-            self.bad_json_str2)
-        self.assertRaises(TypeError, PersonReference.from_json_str,
-            self.bad_json_str3)
-        self.assertRaises(TypeError, PersonReference.from_json_str,
-            self.bad_json_str4)
-        self.assertRaises(TypeError, PersonReference.from_json_str,
-            self.bad_json_str5)
-        self.assertRaises(TypeError, PersonReference.from_json_str,
-            self.bad_json_str6)
-        XLOGGER.debug(
-            "PersonReferenceTest.test_PersonReference_from_json_str: Success")
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    PersonReference.from_json_str(bad_json)
 
-class RecipientTest(unittest.TestCase):
+class RecipientTest(_RecipientAssertions, unittest.TestCase):
     """Collection of unit tests cases for the PersonReference class
     """
 
-    def setUp(self):
-        XLOGGER.debug("RecipientTest.setUp")
-        self.id = "481086d8-357a-4279-b7d5-d7dce48fcd12"
-        self.target_name = "mmcbride"
-        self.recipient_type = RecipientType.GROUP
-        self.externally_owned_f = False
-        self.externally_owned_t = True
-        self.externalKeyT = (
-            "%s%s")%(self.recipient_type.value, self.target_name)
-        self.externalKeyF = None
-        self.locked_list = ["externallyOwned", "externalKey"]
-        self.locked = (','.join('"' + itm + '"' for itm in self.locked_list))
-        self.status = RecipientStatus.ACTIVE
-        self.self = "/api/xm/1/people/9407eb2e-8eb2-43d9-88a8-875237af941d"
-        self.links_json_str = ('{"self": "%s"}')%(self.self)
-        self.links =SelfLink.from_json_str(self.links_json_str)
-        self.pr_json_str1 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(), self.externalKeyT,
-            self.locked, self.status.value, self.links_json_str)
-        XLOGGER.debug(
-            "RecipientTest.setUp - pr_json_str1: %s", self.pr_json_str1)
-        self.pr_json_str2 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower())
-        XLOGGER.debug(
-            "RecipientTest.setUp - pr_json_str2: %s", self.pr_json_str2)
-        self.bad_json1 = (
-            '{"id": 0, "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(), self.externalKeyT,
-            self.locked, self.status.value, self.links_json_str)
-        self.bad_json2 = (
-            '{"id": "%s", "targetName": 0, "recipientType": "%s", '
-            '"externallyOwned": %s, "externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.recipient_type.value,
-            str(self.externally_owned_t).lower(), self.externalKeyT,
-            self.locked, self.status.value, self.links_json_str)
-        self.bad_json3 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": 0, '
-            '"externallyOwned": %s, "externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.target_name,
-            str(self.externally_owned_t).lower(), self.externalKeyT,
-            self.locked, self.status.value, self.links_json_str)
-        self.bad_json4 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": "0", "externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.locked, self.status.value, self.links_json_str)
-        self.bad_json5 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "externalKey": 0, "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.locked, self.status.value, self.links_json_str)
-        self.bad_json6 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "externalKey": "%s", "locked": 0, '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(), self.externalKeyT,
-            self.status.value, self.links_json_str)
-        self.bad_json7 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "externalKey": "%s", "locked": [%s], '
-            '"status": 0, "links": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(), self.externalKeyT,
-            self.locked, self.links_json_str)
-        self.bad_json8 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": 0}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(), self.externalKeyT,
-            self.locked, self.status.value)
-        self.bad_json9 = '{}'
-        self.obj1 = None
-        self.obj2 = None
-
-    def tearDown(self):
-        XLOGGER.debug("RecipientTest.tearDown")
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("RecipientTest.setUpClass")
+        dumps = json.dumps
+        cls.id = "481086d8-357a-4279-b7d5-d7dce48fcd12"
+        cls.target_name = "mmcbride"
+        cls.recipient_type = RecipientType.GROUP
+        rt_val = cls.recipient_type.value
+        cls.externally_owned_f = False
+        cls.externally_owned_t = True
+        cls.externalKeyT = f"{rt_val}{cls.target_name}"
+        cls.externalKeyF = None
+        cls.locked_list = list(_LOCKED)
+        cls.status = _STATUS
+        st_val = cls.status.value
+        cls.self = _SELF
+        links = {"self": cls.self}
+        cls.links = _LINKS
+        cls.args = _RecipientArgs(
+            cls.id, cls.target_name, cls.recipient_type,
+            cls.externally_owned_t, cls.externalKeyT, cls.locked_list,
+            cls.status, cls.links)
+        # The required arguments, not externally owned
+        cls.req_args = cls.args._replace(
+            externally_owned=cls.externally_owned_f)
+        cls.pr_dict2 = {
+            "id": cls.id, "targetName": cls.target_name,
+            "recipientType": rt_val,
+            "externallyOwned": cls.externally_owned_f}
+        cls.pr_dict1 = dict(
+            cls.pr_dict2, externallyOwned=cls.externally_owned_t,
+            externalKey=cls.externalKeyT, locked=cls.locked_list,
+            status=st_val, links=links)
+        cls.pr_json_str1 = dumps(cls.pr_dict1)
+        cls.pr_json_obj1 = json.loads(cls.pr_json_str1)
+        cls.pr_json_str2 = dumps(cls.pr_dict2)
+        XLOGGER.debug(
+            "RecipientTest.setUpClass - pr_json_str1: %s", cls.pr_json_str1)
+        XLOGGER.debug(
+            "RecipientTest.setUpClass - pr_json_str2: %s", cls.pr_json_str2)
+        # Each key in turn given a value of the wrong type
+        bad_values = (
+            ("id", 0), ("targetName", 0), ("recipientType", 0),
+            ("externallyOwned", "0"), ("externalKey", 0), ("locked", 0),
+            ("status", 0), ("links", 0))
+        cls.bad_jsons = tuple(
+            dumps(dict(cls.pr_dict1, **{key: value}))
+            for key, value in bad_values) + ('{}',)
 
     def test_Recipient(self):
-        XLOGGER.debug("RecipientTest.test_Recipient: Start")
-        obj = Recipient(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_t, self.externalKeyT, self.locked_list,
-            self.status, self.links)
-        self.obj1 = obj
+        f = self.args
+        obj = Recipient(*f)
         self.assertIsInstance(obj, Recipient)
-        self.assertEqual(obj.id, self.id)
-        self.assertEqual(obj.target_name, self.target_name)
-        self.assertIsInstance(obj.recipient_type, RecipientType)
-        self.assertEqual(obj.recipient_type, self.recipient_type)
-        self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
-        self.assertEqual(obj.externally_owned, self.externally_owned_t)
-        self.assertEqual(obj.external_key, self.externalKeyT)
-        self.assertEqual(obj.locked, self.locked_list)
-        self.assertIsInstance(obj.status, RecipientStatus)
-        self.assertEqual(obj.status, self.status)
-        self.assertEqual(obj.status.value, self.status.value)
-        self.assertIsInstance(obj.links, SelfLink)
-        self.assertEqual(obj.links, self.links)
-        obj = Recipient(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_f)
-        self.obj2 = obj
+        self._assert_recipient(obj, f)
+        req = self.req_args
+        obj = Recipient(*req[:4])
         self.assertIsInstance(obj, Recipient)
         self.assertRaises(TypeError, Recipient, self.id, self.target_name,
             self.recipient_type)
         self.assertRaises(TypeError, Recipient, self.id, self.target_name)
         self.assertRaises(TypeError, Recipient, self.id)
         self.assertRaises(TypeError, Recipient)
-        self.assertRaises(TypeError, Recipient, 0, self.target_name,
-            self.recipient_type, self.externally_owned_f)
-        self.assertRaises(TypeError, Recipient, self.id, 0,
-            self.recipient_type, self.externally_owned_f)
-        self.assertRaises(TypeError, Recipient, self.id, self.target_name,
-            0, self.externally_owned_f)
-        self.assertRaises(TypeError, Recipient, self.id, self.target_name,
-            self.recipient_type, self.links)
-        XLOGGER.debug(
-            "RecipientTest.test_Recipient: Success")
+        self.assertRaises(TypeError, Recipient, *req._replace(id=0)[:4])
+        self.assertRaises(
+            TypeError, Recipient, *req._replace(target_name=0)[:4])
+        self.assertRaises(
+            TypeError, Recipient, *req._replace(recipient_type=0)[:4])
+        self.assertRaises(
+            TypeError, Recipient,
+            *req._replace(externally_owned=self.links)[:4])
 
     def test_Recipient_from_json_obj(self):
-        XLOGGER.debug(
-            "RecipientTest.test_Recipient_from_json_obj: Start")
-        json_obj = json.loads(self.pr_json_str1)
-        obj = Recipient.from_json_obj(json_obj)
+        obj = Recipient.from_json_obj(self.pr_json_obj1)
         self.assertIsInstance(obj, Recipient)
-        XLOGGER.debug(
-            "RecipientTest.test_Recipient_from_json_obj: Success")
 
     def test_Recipient_from_json_str(self):
-        XLOGGER.debug(
-            "RecipientTest.test_Recipient_from_json_str: Start")
+        f = self.args
         obj = Recipient.from_json_str(self.pr_json_str1)
         self.assertIsInstance(obj, Recipient)
-        self.assertEqual(obj.id, self.id)
-        self.assertEqual(obj.target_name, self.target_name)
-        self.assertIsInstance(obj.recipient_type, RecipientType)
-        self.assertEqual(obj.recipient_type, self.recipient_type)
-        self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
-        self.assertEqual(obj.externally_owned, self.externally_owned_t)
-        self.assertEqual(obj.external_key, self.externalKeyT)
-        self.assertEqual(obj.locked, self.locked_list)
-        self.assertIsInstance(obj.status, RecipientStatus)
-        self.assertEqual(obj.status, self.status)
-        self.assertEqual(obj.status.value, self.status.value)
-        self.assertIsInstance(obj.links, SelfLink)
-        self.assertEqual(obj.links.self, self.links.self)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json1)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json2)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json3)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json4)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json5)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json6)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json7)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json8)
-        self.assertRaises(TypeError, Recipient.from_json_str, self.bad_json9)
+        self._assert_recipient(obj, f)
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    Recipient.from_json_str(bad_json)
         obj = Recipient.from_json_str(self.pr_json_str2)
         self.assertIsInstance(obj, Recipient)
         self.assertEqual(obj.id, self.id)
@@ -362,140 +275,72 @@ class RecipientTest(unittest.TestCase):
         self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
         self.assertEqual(obj.externally_owned, self.externally_owned_f)
         self.assertEqual(obj.external_key, self.externalKeyF)
-        XLOGGER.debug(
-            "RecipientTest.test_Recipient_from_json_str: Success")
 
-class DynamicTeamTest(unittest.TestCase):
+class DynamicTeamTest(_RecipientAssertions, unittest.TestCase):
     """Collection of unit tests cases for the DynamicTeam class
     """
 
-    def setUp(self):
-        XLOGGER.debug("DynamicTeamTest.setUp")
-        self.id = "481086d8-357a-4279-b7d5-d7dce48fcd12"
-        self.target_name = "mmcbride"
-        self.recipient_type = RecipientType.DYNAMIC_TEAM
-        self.externally_owned_f = False
-        self.externally_owned_t = True
-        self.useEmergencyDevice = True
-        self.externalKeyT = (
-            "%s%s")%(self.recipient_type.value, self.target_name)
-        self.externalKeyF = None
-        self.locked_list = ["externallyOwned", "externalKey"]
-        self.locked = (','.join('"' + itm + '"' for itm in self.locked_list))
-        self.status = RecipientStatus.ACTIVE
-        self.self = "/api/xm/1/people/9407eb2e-8eb2-43d9-88a8-875237af941d"
-        self.links_json_str = ('{"self": "%s"}')%(self.self)
-        self.links =SelfLink.from_json_str(self.links_json_str)
-        self.pr_json_str1 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": %s, '
-            '"externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            str(self.useEmergencyDevice).lower(),
-            self.externalKeyT, self.locked, self.status.value,
-            self.links_json_str)
-        XLOGGER.debug(
-            "DynamicTeamTest.setUp - pr_json_str1: %s", self.pr_json_str1)
-        self.pr_json_str2 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.useEmergencyDevice).lower())
-        XLOGGER.debug(
-            "DynamicTeamTest.setUp - pr_json_str2: %s", self.pr_json_str2)
-        self.bad_json1 = (
-            '{"targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": %s}'
-            )%(self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.useEmergencyDevice).lower())
-        self.bad_json2 = (
-            '{"id": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": %s}'
-            )%(self.id, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.useEmergencyDevice).lower())
-        self.bad_json3 = (
-            '{"id": "%s", "targetName": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": %s}'
-            )%(self.id, self.target_name,
-            str(self.externally_owned_f).lower(),
-            str(self.useEmergencyDevice).lower())
-        self.bad_json4 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"useEmergencyDevice": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.useEmergencyDevice).lower())
-        self.bad_json5 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower())
-        self.bad_json6 = (
-            '{"id": 0, "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": %s}'
-            )%(self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.useEmergencyDevice).lower())
-        self.bad_json7 = (
-            '{"id": "%s", "targetName": 0, "recipientType": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": %s}'
-            )%(self.id, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.useEmergencyDevice).lower())
-        self.bad_json8 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": 0, '
-            '"externallyOwned": %s, "useEmergencyDevice": %s}'
-            )%(self.id, self.target_name,
-            str(self.externally_owned_f).lower(),
-            str(self.useEmergencyDevice).lower())
-        self.bad_json9 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": "0", "useEmergencyDevice": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.useEmergencyDevice).lower())
-        self.bad_json10 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "useEmergencyDevice": "0"}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower())
-        self.bad_json11 = '{}'
-        self.obj1 = None
-        self.obj2 = None
-
-
-    def tearDown(self):
-        XLOGGER.debug("DynamicTeamTest.tearDown")
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("DynamicTeamTest.setUpClass")
+        dumps = json.dumps
+        cls.id = "481086d8-357a-4279-b7d5-d7dce48fcd12"
+        cls.target_name = "mmcbride"
+        cls.recipient_type = RecipientType.DYNAMIC_TEAM
+        rt_val = cls.recipient_type.value
+        cls.externally_owned_f = False
+        cls.externally_owned_t = True
+        cls.useEmergencyDevice = True
+        cls.externalKeyT = f"{rt_val}{cls.target_name}"
+        cls.externalKeyF = None
+        cls.locked_list = list(_LOCKED)
+        cls.status = _STATUS
+        st_val = cls.status.value
+        cls.self = _SELF
+        links = {"self": cls.self}
+        cls.links = _LINKS
+        cls.args = _DynamicTeamArgs(
+            cls.id, cls.target_name, cls.recipient_type,
+            cls.externally_owned_t, cls.useEmergencyDevice, cls.externalKeyT,
+            cls.locked_list, cls.status, cls.links)
+        cls.pr_dict2 = {
+            "id": cls.id, "targetName": cls.target_name,
+            "recipientType": rt_val,
+            "externallyOwned": cls.externally_owned_f,
+            "useEmergencyDevice": cls.useEmergencyDevice}
+        cls.pr_dict1 = dict(
+            cls.pr_dict2, externallyOwned=cls.externally_owned_t,
+            externalKey=cls.externalKeyT, locked=cls.locked_list,
+            status=st_val, links=links)
+        cls.pr_json_str1 = dumps(cls.pr_dict1)
+        cls.pr_json_obj1 = json.loads(cls.pr_json_str1)
+        cls.pr_json_str2 = dumps(cls.pr_dict2)
+        XLOGGER.debug(
+            "DynamicTeamTest.setUpClass - pr_json_str1: %s", cls.pr_json_str1)
+        XLOGGER.debug(
+            "DynamicTeamTest.setUpClass - pr_json_str2: %s", cls.pr_json_str2)
+        # Each required key missing, then each key with the wrong type
+        required = (
+            "id", "targetName", "externallyOwned", "useEmergencyDevice")
+        bad_values = (
+            ("id", 0), ("targetName", 0), ("recipientType", 0),
+            ("externallyOwned", "0"), ("useEmergencyDevice", "0"))
+        cls.bad_jsons = tuple(
+            dumps(_without(cls.pr_dict2, key))
+            for key in required) + tuple(
+                dumps(dict(cls.pr_dict2, **{key: value}))
+                for key, value in bad_values) + ('{}',)
+        cls.no_type_json = dumps(_without(cls.pr_dict2, "recipientType"))
 
     def test_DynamicTeam(self):
-        XLOGGER.debug("DynamicTeamTest.test_DynamicTeam: Start")
-        obj = DynamicTeam(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_t, self.useEmergencyDevice, self.externalKeyT,
-            self.locked_list, self.status, self.links)
-        self.obj1 = obj
+        f = self.args
+        obj = DynamicTeam(*f)
         self.assertIsInstance(obj, DynamicTeam)
-        self.assertEqual(obj.id, self.id)
-        self.assertEqual(obj.target_name, self.target_name)
-        self.assertIsInstance(obj.recipient_type, RecipientType)
-        self.assertEqual(obj.recipient_type, self.recipient_type)
-        self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
-        self.assertEqual(obj.externally_owned, self.externally_owned_t)
-        self.assertEqual(obj.use_emergency_device, self.useEmergencyDevice)
-        self.assertEqual(obj.external_key, self.externalKeyT)
-        self.assertEqual(obj.locked, self.locked_list)
-        self.assertIsInstance(obj.status, RecipientStatus)
-        self.assertEqual(obj.status, self.status)
-        self.assertEqual(obj.status.value, self.status.value)
-        self.assertIsInstance(obj.links, SelfLink)
-        self.assertEqual(obj.links, self.links)
+        self._assert_recipient(obj, f)
+        self.assertEqual(obj.use_emergency_device, f.use_emergency_device)
         obj = DynamicTeam(
             self.id, self.target_name, self.recipient_type,
             self.externally_owned_f, self.useEmergencyDevice)
-        self.obj2 = obj
         self.assertIsInstance(obj, DynamicTeam)
         self.assertRaises(TypeError, DynamicTeam, self.id, self.target_name,
             self.recipient_type)
@@ -510,58 +355,24 @@ class DynamicTeamTest(unittest.TestCase):
             0, self.externally_owned_f)
         self.assertRaises(TypeError, DynamicTeam, self.id, self.target_name,
             self.recipient_type, self.links)
-        XLOGGER.debug(
-            "DynamicTeamTest.test_DynamicTeam: Success")
 
     def test_DynamicTeam_from_json_obj(self):
-        XLOGGER.debug(
-            "DynamicTeamTest.test_DynamicTeam_from_json_obj: Start")
-        json_obj = json.loads(self.pr_json_str1)
-        obj = DynamicTeam.from_json_obj(json_obj)
+        obj = DynamicTeam.from_json_obj(self.pr_json_obj1)
         self.assertIsInstance(obj, DynamicTeam)
-        XLOGGER.debug(
-            "DynamicTeamTest.test_DynamicTeam_from_json_obj: Success")
 
     def test_DynamicTeam_from_json_str(self):
-        XLOGGER.debug(
-            "DynamicTeamTest.test_DynamicTeam_from_json_str: Start")
+        f = self.args
         obj = DynamicTeam.from_json_str(self.pr_json_str1)
         self.assertIsInstance(obj, DynamicTeam)
-        self.assertEqual(obj.id, self.id)
-        self.assertEqual(obj.target_name, self.target_name)
-        self.assertIsInstance(obj.recipient_type, RecipientType)
-        self.assertEqual(obj.recipient_type, self.recipient_type)
-        self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
-        self.assertEqual(obj.externally_owned, self.externally_owned_t)
-        self.assertEqual(obj.external_key, self.externalKeyT)
-        self.assertEqual(obj.locked, self.locked_list)
-        self.assertIsInstance(obj.status, RecipientStatus)
-        self.assertEqual(obj.status, self.status)
-        self.assertEqual(obj.status.value, self.status.value)
-        self.assertIsInstance(obj.links, SelfLink)
-        self.assertEqual(obj.links.self, self.links.self)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json1)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json2)
+        self._assert_recipient(obj, f)
+        self.assertEqual(obj.use_emergency_device, f.use_emergency_device)
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    DynamicTeam.from_json_str(bad_json)
+        # recipientType is always DYNAMIC_TEAM, so it may be omitted
         self.assertRaises(AssertionError, self.assertRaises,
-            TypeError, DynamicTeam.from_json_str, self.bad_json3)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json4)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json5)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json6)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json7)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json8)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json9)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json10)
-        self.assertRaises(
-            TypeError, DynamicTeam.from_json_str, self.bad_json11)
+            TypeError, DynamicTeam.from_json_str, self.no_type_json)
         obj = DynamicTeam.from_json_str(self.pr_json_str2)
         self.assertIsInstance(obj, DynamicTeam)
         self.assertEqual(obj.id, self.id)
@@ -571,219 +382,94 @@ class DynamicTeamTest(unittest.TestCase):
         self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
         self.assertEqual(obj.externally_owned, self.externally_owned_f)
         self.assertEqual(obj.external_key, self.externalKeyF)
-        XLOGGER.debug(
-            "DynamicTeamTest.test_DynamicTeam_from_json_str: Success")
 
-class GroupTest(unittest.TestCase):
+class GroupTest(_RecipientAssertions, unittest.TestCase):
     """Collection of unit tests cases for the Group class
     """
 
-    def setUp(self):
-        XLOGGER.debug("GroupTest.setUp")
-        self.id = "438e9245-b32d-445f-916bd3e07932c892"
-        self.target_name = "Oracle Administrators"
-        self.recipient_type = RecipientType.GROUP
-        self.externally_owned_f = False
-        self.externally_owned_t = True
-        self.allowDuplicates = False
-        self.useDefaultDevices = True
-        self.observedByAll = True
-        self.description = "Oracle database administrators"
-        self.site_id = "dbf90cbf-a745-a054-abf0-cb3b5b56e6bd"
-        self.site_self = "/api/xm/1/sites/dbf90cbf-a745-a054-abf0-cb3b5b56e6bd"
-        self.site_previous = None
-        self.site_next = None
-        self.site_links_json_str = ('{"self": "%s"}')%(self.site_self)
-        self.site_links = SelfLink.from_json_str(self.site_links_json_str)
-        self.site_json_str = (
-            '{"id": "%s", "links": %s}'
-            )%(self.site_id, self.site_links_json_str)
-        self.site_obj = ReferenceByIdAndSelfLink.from_json_str(
-            self.site_json_str)
-        self.externalKeyT = (
-            "%s%s")%(self.recipient_type.value, self.target_name)
-        self.externalKeyF = None
-        self.locked_list = ["externallyOwned", "externalKey"]
-        self.locked = (', '.join('"' + itm + '"' for itm in self.locked_list))
-        self.status = RecipientStatus.ACTIVE
-        self.self = "/api/xm/1/groups/438e9245-b32d-445f-916bd3e07932c892"
-        self.links_json_str = ('{"self": "%s"}')%(self.self)
-        self.links =SelfLink.from_json_str(self.links_json_str)
-        self.pr_json_str1 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": %s, '
-            '"site": %s, "externalKey": "%s", "locked": [%s], '
-            '"status": "%s", "links": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower(),
-            self.site_json_str, self.externalKeyT, self.locked,
-            self.status.value, self.links_json_str)
-        XLOGGER.debug(
-            "GroupTest.setUp - pr_json_str1: %s", self.pr_json_str1)
-        self.pr_json_str2 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        XLOGGER.debug(
-            "GroupTest.setUp - pr_json_str2: %s", self.pr_json_str2)
-        self.bad_json1 = (
-            '{"targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json2 = (
-            '{"id": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json3 = (
-            '{"id": "%s", "targetName": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.target_name,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json4 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json5 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json6 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s,'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json7 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.useDefaultDevices).lower())
-        self.bad_json8 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower())
-        self.bad_json9 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": "0", '
-            '"description": "%s", '
-            '"observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            self.description,
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json10 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": 0,'
-            ' "observedByAll": %s, "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            str(self.observedByAll).lower(),
-            str(self.useDefaultDevices).lower())
-        self.bad_json11 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": "0", "useDefaultDevices": %s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.useDefaultDevices).lower())
-        self.bad_json12 = (
-            '{"id": "%s", "targetName": "%s", "recipientType": "%s", '
-            '"externallyOwned": %s, "allowDuplicates": %s, "description": "%s",'
-            ' "observedByAll": %s, "useDefaultDevices": "0"}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_f).lower(),
-            str(self.allowDuplicates).lower(),
-            self.description,
-            str(self.observedByAll).lower())
-        self.bad_json13 = '{}'
-
-    def tearDown(self):
-        XLOGGER.debug("GroupTest.tearDown")
+    @classmethod
+    def setUpClass(cls):
+        XLOGGER.debug("GroupTest.setUpClass")
+        dumps = json.dumps
+        cls.id = "438e9245-b32d-445f-916bd3e07932c892"
+        cls.target_name = "Oracle Administrators"
+        cls.recipient_type = RecipientType.GROUP
+        rt_val = cls.recipient_type.value
+        cls.externally_owned_f = False
+        cls.externally_owned_t = True
+        cls.allowDuplicates = False
+        cls.useDefaultDevices = True
+        cls.observedByAll = True
+        cls.description = "Oracle database administrators"
+        cls.site_id = "dbf90cbf-a745-a054-abf0-cb3b5b56e6bd"
+        cls.site_self = "/api/xm/1/sites/dbf90cbf-a745-a054-abf0-cb3b5b56e6bd"
+        cls.site_previous = None
+        cls.site_next = None
+        site_links = {"self": cls.site_self}
+        cls.site_links = SelfLink(cls.site_self)
+        site = {"id": cls.site_id, "links": site_links}
+        cls.site_obj = ReferenceByIdAndSelfLink(cls.site_id, cls.site_links)
+        cls.externalKeyT = f"{rt_val}{cls.target_name}"
+        cls.externalKeyF = None
+        cls.locked_list = list(_LOCKED)
+        cls.status = _STATUS
+        st_val = cls.status.value
+        cls.self = "/api/xm/1/groups/438e9245-b32d-445f-916bd3e07932c892"
+        links = {"self": cls.self}
+        cls.links = SelfLink(cls.self)
+        cls.args = _GroupArgs(
+            cls.id, cls.target_name, cls.recipient_type,
+            cls.externally_owned_t, cls.allowDuplicates, cls.description,
+            cls.observedByAll, cls.useDefaultDevices, cls.site_obj,
+            cls.externalKeyT, cls.locked_list, cls.status, cls.links)
+        # Just the required arguments, not externally owned
+        cls.min_args = tuple(cls.args._replace(
+            externally_owned=cls.externally_owned_f))[:8]
+        # Expected results of parsing pr_json_str1 and pr_json_str2
+        cls.group = Group(*cls.args)
+        cls.min_group = Group(*cls.min_args)
+        cls.pr_dict2 = {
+            "id": cls.id, "targetName": cls.target_name,
+            "recipientType": rt_val,
+            "externallyOwned": cls.externally_owned_f,
+            "allowDuplicates": cls.allowDuplicates,
+            "description": cls.description,
+            "observedByAll": cls.observedByAll,
+            "useDefaultDevices": cls.useDefaultDevices}
+        cls.pr_dict1 = dict(
+            cls.pr_dict2, externallyOwned=cls.externally_owned_t,
+            site=site, externalKey=cls.externalKeyT,
+            locked=cls.locked_list, status=st_val, links=links)
+        cls.pr_json_str1 = dumps(cls.pr_dict1)
+        cls.pr_json_obj1 = json.loads(cls.pr_json_str1)
+        cls.pr_json_str2 = dumps(cls.pr_dict2)
+        XLOGGER.debug(
+            "GroupTest.setUpClass - pr_json_str1: %s", cls.pr_json_str1)
+        XLOGGER.debug(
+            "GroupTest.setUpClass - pr_json_str2: %s", cls.pr_json_str2)
+        # Each key missing, then each of the Group's own keys with the
+        # wrong type
+        bad_values = (
+            ("allowDuplicates", "0"), ("description", 0),
+            ("observedByAll", "0"), ("useDefaultDevices", "0"))
+        cls.bad_jsons = tuple(
+            dumps(_without(cls.pr_dict2, key))
+            for key in cls.pr_dict2) + tuple(
+                dumps(dict(cls.pr_dict2, **{key: value}))
+                for key, value in bad_values) + ('{}',)
 
     def test_Group(self):
-        XLOGGER.debug("GroupTest.test_Group: Start")
-        obj = Group(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_t, self.allowDuplicates, self.description,
-            self.observedByAll, self.useDefaultDevices, self.site_obj,
-            self.externalKeyT, self.locked_list, self.status, self.links)
+        f = self.args
+        obj = Group(*f)
         self.assertIsInstance(obj, Group)
-        self.assertEqual(obj.id, self.id)
-        self.assertEqual(obj.target_name, self.target_name)
-        self.assertIsInstance(obj.recipient_type, RecipientType)
-        self.assertEqual(obj.recipient_type, self.recipient_type)
-        self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
-        self.assertEqual(obj.externally_owned, self.externally_owned_t)
-        self.assertEqual(obj.allow_duplicates, self.allowDuplicates)
-        self.assertEqual(obj.description, self.description)
-        self.assertEqual(obj.observed_by_all, self.observedByAll)
+        self._assert_recipient(obj, f)
+        self.assertEqual(obj.allow_duplicates, f.allow_duplicates)
+        self.assertEqual(obj.description, f.description)
+        self.assertEqual(obj.observed_by_all, f.observed_by_all)
+        self.assertEqual(obj.use_default_devices, f.use_default_devices)
         self.assertIsInstance(obj.site, ReferenceByIdAndSelfLink)
-        self.assertEqual(obj.site, self.site_obj)
-        self.assertEqual(obj.external_key, self.externalKeyT)
-        self.assertEqual(obj.locked, self.locked_list)
-        self.assertIsInstance(obj.status, RecipientStatus)
-        self.assertEqual(obj.status, self.status)
-        self.assertEqual(obj.status.value, self.status.value)
-        self.assertIsInstance(obj.links, SelfLink)
-        self.assertEqual(obj.links, self.links)
-        obj2 = Group(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_f, self.allowDuplicates, self.description,
-            self.observedByAll, self.useDefaultDevices)
+        self.assertEqual(obj.site, f.site)
+        obj2 = Group(*self.min_args)
         self.assertIsInstance(obj2, Group)
         self.assertRaises(TypeError, Group, self.id, self.target_name,
             self.recipient_type)
@@ -798,74 +484,32 @@ class GroupTest(unittest.TestCase):
             0, self.externally_owned_f)
         self.assertRaises(TypeError, Group, self.id, self.target_name,
             self.recipient_type, self.links)
-        XLOGGER.debug(
-            "GroupTest.test_Group: Success")
 
     def test_Group_from_json_obj(self):
-        XLOGGER.debug(
-            "GroupTest.test_Group_from_json_obj: Start")
-        json_obj = json.loads(self.pr_json_str1)
-        obj = Group.from_json_obj(json_obj)
+        obj = Group.from_json_obj(self.pr_json_obj1)
         self.assertIsInstance(obj, Group)
-        obj1 = Group(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_t, self.allowDuplicates, self.description,
-            self.observedByAll, self.useDefaultDevices, self.site_obj,
-            self.externalKeyT, self.locked_list, self.status, self.links)
-        self.assertEqual(obj, obj1)
-        XLOGGER.debug(
-            "GroupTest.test_Group_from_json_obj: Success")
+        self.assertEqual(obj, self.group)
 
     def test_Group_from_json_str(self):
-        XLOGGER.debug(
-            "GroupTest.test_Group_from_json_str: Start")
         obj = Group.from_json_str(self.pr_json_str1)
         self.assertIsInstance(obj, Group)
-        obj1 = Group(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_t, self.allowDuplicates, self.description,
-            self.observedByAll, self.useDefaultDevices, self.site_obj,
-            self.externalKeyT, self.locked_list, self.status, self.links)
-        self.assertEqual(obj, obj1)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json1)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json2)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json3)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json4)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json5)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json6)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json7)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json8)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json9)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json10)
-        self.assertRaises(
-            TypeError, Group.from_json_str, self.bad_json11)
+        self.assertEqual(obj, self.group)
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    Group.from_json_str(bad_json)
         obj = Group.from_json_str(self.pr_json_str2)
         self.assertIsInstance(obj, Group)
-        obj2 = Group(
-            self.id, self.target_name, self.recipient_type,
-            self.externally_owned_f, self.allowDuplicates, self.description,
-            self.observedByAll, self.useDefaultDevices)
-        self.assertEqual(obj, obj2)
-        XLOGGER.debug(
-            "GroupTest.test_Group_from_json_str: Success")
+        self.assertEqual(obj, self.min_group)
 
-class PersonTest(unittest.TestCase):
+class PersonTest(_RecipientAssertions, unittest.TestCase):
     """Collection of unit tests cases for the Person class
     """
 
-    def setUp(self):#pylint: disable=too-many-statements
-        XLOGGER.debug("PersonTest.setUp")
-        self.test_data = (
+    @classmethod
+    def setUpClass(cls):#pylint: disable=too-many-statements
+        XLOGGER.debug("PersonTest.setUpClass")
+        cls.test_data = (
         '{'
         '"id":"ac06ca54-1709-432b-9050-11701710e01b",'
         '"targetName":"fleiter1234",'
@@ -893,400 +537,95 @@ class PersonTest(unittest.TestCase):
         '"links":{'
         '"self":"/api/xm/1/people/ac06ca54-1709-432b-9050-11701710e01b"}'
         '}')
-        XLOGGER.debug("PersonTest.setUp - self.test_data: %s", self.test_data)
-        self.id = "ac06ca54-1709-432b-9050-11701710e01b"
-        self.target_name = "fleiter1234"
-        self.recipient_type = RecipientType.PERSON
-        self.externally_owned_f = False
-        self.externally_owned_t = True
-        self.external_key = "PERSONfleiter1234"
-        self.self = "/api/xm/1/people/ac06ca54-1709-432b-9050-11701710e01b"
-        self.links_json_str = ('{"self":"%s"}')%(self.self)
-        self.links =SelfLink.from_json_str(self.links_json_str)
-        self.first_name = "Felix"
-        self.last_name  = "Leiter"
-        self.language = "en"
-        self.timezone = "US/Pacific"
-        self.web_login = "fleiter1234"
-        self.phone_login = "fleiter1234"
-        self.properties_json_str = (
-            '{"Department":"Finance","Job Title":"Analyst"}')
-        self.properties = dict([
-            ("Department","Finance"),("Job Title","Analyst")
-            ])
-        self.roles_json_str = ('{"count":1,"total":1,"data":[%s]}')%(
-            ('{"id":"6ff659d1-353e-424c-8dd3-f8cba6fc15a0",'
-             '"name":"Full Access User"}'))
-        self.roles = RolePagination.from_json_str(self.roles_json_str)
-        self.site_id = "7f84fa10-70a6-45f6-9cae-2185fcba8993"
-        self.site_self = "/api/xm/1/sites/7f84fa10-70a6-45f6-9cae-2185fcba8993"
-        self.site_links_json_str = ('{"self":"%s"}')%(self.site_self)
-        self.site_links = SelfLink.from_json_str(self.site_links_json_str)
-        self.site_json_str = ('{"id":"%s","links":%s}')%(
-            self.site_id, self.site_links_json_str)
-        self.site = ReferenceByIdAndSelfLink.from_json_str(
-            self.site_json_str)
-        self.externalKeyT = (
-            "%s%s")%(self.recipient_type.value, self.target_name)
-        self.externalKeyF = None
-        self.locked_list = ["externallyOwned","externalKey"]
-        self.locked = (','.join('"' + itm + '"' for itm in self.locked_list))
-        self.status = RecipientStatus.ACTIVE
-        self.self = "/api/xm/1/people/ac06ca54-1709-432b-9050-11701710e01b"
-        self.json_str1 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s,"phoneLogin":"%s","properties":%s,"roles":%s,'
-            '"externalKey":"%s","locked":[%s],"status":"%s","links":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str,
-            self.phone_login,
-            self.properties_json_str,
-            self.roles_json_str,
-            self.externalKeyT, self.locked,
-            self.status.value, self.links_json_str)
-        XLOGGER.debug("PersonTest.setUp - json_str1: %s", self.json_str1)
-        self.json_str2 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s","site":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        XLOGGER.debug("PersonTest.setUp - json_str2: %s", self.json_str2)
-        #Missing required field errors
-        self.bad_json1 = (
-            '{"targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json2 = (
-            '{"id":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.id, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json3 = (
-            '{"id":"%s","targetName":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.id, self.target_name,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json4 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json5 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json6 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json7 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"timezone":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.timezone,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json8 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","webLogin":"%s",'
-            '"site":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.web_login,
-            self.site_json_str)
-        self.bad_json9 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s",'
-            '"site":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.site_json_str)
-        self.bad_json10 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s"}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login)
-        #Bad data type errors
-        self.bad_json11 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":0, "lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s,"phoneLogin":"%s","properties":%s,"roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str,
-            self.phone_login,
-            self.properties_json_str,
-            self.roles_json_str)
-        self.bad_json12 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":0, '
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s,"phoneLogin":"%s","properties":%s,"roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str,
-            self.phone_login,
-            self.properties_json_str,
-            self.roles_json_str)
-        self.bad_json13 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":0, "timezone":"%s","webLogin":"%s",'
-            '"site":%s,"phoneLogin":"%s","properties":%s,"roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.timezone,
-            self.web_login,
-            self.site_json_str,
-            self.phone_login,
-            self.properties_json_str,
-            self.roles_json_str)
-        self.bad_json14 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":0, "webLogin":"%s",'
-            '"site":%s,"phoneLogin":"%s","properties":%s,"roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.web_login,
-            self.site_json_str,
-            self.phone_login,
-            self.properties_json_str,
-            self.roles_json_str)
-        self.bad_json15 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":0, '
-            '"site":%s,"phoneLogin":"%s","properties":%s,"roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.site_json_str,
-            self.phone_login,
-            self.properties_json_str,
-            self.roles_json_str)
-        self.bad_json16 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":0, "phoneLogin":"%s","properties":%s,"roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.phone_login,
-            self.properties_json_str,
-            self.roles_json_str)
-        self.bad_json17 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s,"phoneLogin":0, "properties":%s,"roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str,
-            self.properties_json_str,
-            self.roles_json_str)
-        self.bad_json18 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s,"phoneLogin":"%s","properties":0, "roles":%s}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str,
-            self.phone_login,
-            self.roles_json_str)
-        self.bad_json19 = (
-            '{"id":"%s","targetName":"%s","recipientType":"%s",'
-            '"externallyOwned":%s,"firstName":"%s","lastName":"%s",'
-            '"language":"%s","timezone":"%s","webLogin":"%s",'
-            '"site":%s,"phoneLogin":"%s","properties":%s,"roles":0}'
-            )%(self.id, self.target_name, self.recipient_type.value,
-            str(self.externally_owned_t).lower(),
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site_json_str,
-            self.phone_login,
-            self.properties_json_str)
-        self.bad_json20 = '{}'
-
-    def tearDown(self):
-        XLOGGER.debug("PersonTest.tearDown")
+        dumps = json.dumps
+        cls.id = "ac06ca54-1709-432b-9050-11701710e01b"
+        cls.target_name = "fleiter1234"
+        cls.recipient_type = RecipientType.PERSON
+        rt_val = cls.recipient_type.value
+        cls.externally_owned_f = False
+        cls.externally_owned_t = True
+        cls.external_key = "PERSONfleiter1234"
+        cls.self = "/api/xm/1/people/ac06ca54-1709-432b-9050-11701710e01b"
+        links = {"self": cls.self}
+        cls.links = SelfLink(cls.self)
+        cls.first_name = "Felix"
+        cls.last_name  = "Leiter"
+        cls.language = "en"
+        cls.timezone = "US/Pacific"
+        cls.web_login = "fleiter1234"
+        cls.phone_login = "fleiter1234"
+        cls.properties = {"Department": "Finance", "Job Title": "Analyst"}
+        roles = {"count": 1, "total": 1, "data": [{
+            "id": "6ff659d1-353e-424c-8dd3-f8cba6fc15a0",
+            "name": "Full Access User"}]}
+        cls.roles = RolePagination.from_json_obj(roles)
+        cls.site_id = "7f84fa10-70a6-45f6-9cae-2185fcba8993"
+        cls.site_self = "/api/xm/1/sites/7f84fa10-70a6-45f6-9cae-2185fcba8993"
+        site = {"id": cls.site_id, "links": {"self": cls.site_self}}
+        cls.site_links = SelfLink(cls.site_self)
+        cls.site = ReferenceByIdAndSelfLink(cls.site_id, cls.site_links)
+        cls.externalKeyT = f"{rt_val}{cls.target_name}"
+        cls.externalKeyF = None
+        cls.locked_list = list(_LOCKED)
+        cls.status = _STATUS
+        st_val = cls.status.value
+        cls.args = _PersonArgs(
+            cls.id, cls.target_name, cls.recipient_type,
+            cls.externally_owned_t, cls.first_name, cls.last_name,
+            cls.language, cls.timezone, cls.web_login, cls.site,
+            cls.phone_login, cls.properties, cls.roles, cls.externalKeyT,
+            cls.locked_list, cls.status, cls.links)
+        # Just the required arguments
+        cls.min_args = tuple(cls.args)[:10]
+        json_dict2 = {
+            "id": cls.id, "targetName": cls.target_name,
+            "recipientType": rt_val,
+            "externallyOwned": cls.externally_owned_t,
+            "firstName": cls.first_name, "lastName": cls.last_name,
+            "language": cls.language, "timezone": cls.timezone,
+            "webLogin": cls.web_login, "site": site}
+        json_dict1 = dict(
+            json_dict2, phoneLogin=cls.phone_login,
+            properties=cls.properties, roles=roles,
+            externalKey=cls.externalKeyT, locked=cls.locked_list,
+            status=st_val, links=links)
+        # Compact separators, to match the output of Person.json
+        cls.json_str1 = dumps(json_dict1, separators=(',', ':'))
+        cls.json_str2 = dumps(json_dict2, separators=(',', ':'))
+        XLOGGER.debug(
+            "PersonTest.setUpClass - json_str1: %s", cls.json_str1)
+        XLOGGER.debug(
+            "PersonTest.setUpClass - json_str2: %s", cls.json_str2)
+        # Each required key missing in turn, then each of the person's own
+        # fields given a value of the wrong type
+        full = dict(
+            json_dict2, phoneLogin=cls.phone_login,
+            properties=cls.properties, roles=roles)
+        cls.bad_jsons = tuple(
+            dumps(_without(json_dict2, key)) for key in json_dict2) + tuple(
+                dumps(dict(full, **{key: 0})) for key in (
+                    "firstName", "lastName", "language", "timezone",
+                    "webLogin", "site", "phoneLogin", "properties", "roles")
+                ) + ('{}',)
 
     def test_Person(self):
-        XLOGGER.debug("PersonTest.test_Person: Start")
-        obj = Person(
-            self.id,
-            self.target_name,
-            self.recipient_type,
-            self.externally_owned_t,
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site,
-            self.phone_login,
-            self.properties,
-            self.roles,
-            self.externalKeyT,
-            self.locked_list,
-            self.status,
-            self.links)
+        f = self.args
+        obj = Person(*f)
         self.assertIsInstance(obj, Person)
-        self.assertEqual(obj.id, self.id)
-        self.assertEqual(obj.target_name, self.target_name)
-        self.assertIsInstance(obj.recipient_type, RecipientType)
-        self.assertEqual(obj.recipient_type, self.recipient_type)
-        self.assertEqual(obj.recipient_type.value, self.recipient_type.value)
-        self.assertEqual(obj.externally_owned, self.externally_owned_t)
-        self.assertEqual(obj.first_name, self.first_name)
-        self.assertEqual(obj.last_name, self.last_name)
-        self.assertEqual(obj.language, self.language)
-        self.assertEqual(obj.timezone, self.timezone)
-        self.assertEqual(obj.web_login, self.web_login)
+        self._assert_recipient(obj, f)
+        self.assertEqual(obj.first_name, f.first_name)
+        self.assertEqual(obj.last_name, f.last_name)
+        self.assertEqual(obj.language, f.language)
+        self.assertEqual(obj.timezone, f.timezone)
+        self.assertEqual(obj.web_login, f.web_login)
         self.assertIsInstance(obj.site, ReferenceByIdAndSelfLink)
-        self.assertEqual(obj.site, self.site)
-        self.assertEqual(obj.phone_login, self.phone_login)
+        self.assertEqual(obj.site, f.site)
+        self.assertEqual(obj.phone_login, f.phone_login)
         self.assertIsInstance(obj.properties, dict)
-        self.assertEqual(obj.properties, self.properties)
+        self.assertDictEqual(obj.properties, f.properties)
         self.assertIsInstance(obj.roles, RolePagination)
-        self.assertEqual(obj.roles, self.roles)
-        self.assertEqual(obj.external_key, self.externalKeyT)
-        self.assertEqual(obj.locked, self.locked_list)
-        self.assertIsInstance(obj.status, RecipientStatus)
-        self.assertEqual(obj.status, self.status)
-        self.assertEqual(obj.status.value, self.status.value)
-        self.assertIsInstance(obj.links, SelfLink)
-        self.assertEqual(obj.links, self.links)
-        obj2 = Person(
-            self.id,
-            self.target_name,
-            self.recipient_type,
-            self.externally_owned_t,
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site)
+        self.assertEqual(obj.roles, f.roles)
+        obj2 = Person(*self.min_args)
         self.assertIsInstance(obj2, Person)
         self.assertRaises(TypeError, Person)
         self.assertRaises(TypeError, Person, self.id)
@@ -1301,130 +640,44 @@ class PersonTest(unittest.TestCase):
             0, self.externally_owned_f)
         self.assertRaises(TypeError, Person, self.id, self.target_name,
             self.recipient_type, self.links)
-        XLOGGER.debug(
-            "PersonTest.test_Person: Success")
 
     def test_Person_from_json_obj(self):
-        XLOGGER.debug(
-            "PersonTest.test_Person_from_json_obj: Start")
         json_obj = json.loads(self.json_str2)
         obj = Person.from_json_obj(json_obj)
         self.assertIsInstance(obj, Person)
-        obj2 = Person(
-            self.id,
-            self.target_name,
-            self.recipient_type,
-            self.externally_owned_t,
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site)
+        obj2 = Person(*self.min_args)
         self.assertEqual(obj, obj2)
-        XLOGGER.debug(
-            "PersonTest.test_Person_from_json_obj: Success")
 
     def test_Person_from_json_str(self):
-        XLOGGER.debug(
-            "PersonTest.test_Person_from_json_str: Start")
         obj = Person.from_json_str(self.json_str1)
         self.assertIsInstance(obj, Person)
+        jstr = obj.json
         XLOGGER.debug(
-            "PersonTest.test_Person_from_json_str: obj: %s",
-            repr(obj))
+            "PersonTest.test_Person_from_json_str: obj: %r", obj)
         XLOGGER.debug(
             "PersonTest.test_Person_from_json_str: json.dumps(obj): %s",
-            obj.json)
-        assert self.json_str1 == obj.json
-        obj1 = Person(
-            self.id,
-            self.target_name,
-            self.recipient_type,
-            self.externally_owned_t,
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site,
-            self.phone_login,
-            self.properties,
-            self.roles,
-            self.externalKeyT,
-            self.locked_list,
-            self.status,
-            self.links)
+            jstr)
+        self.assertEqual(jstr, self.json_str1)
+        obj1 = Person(*self.args)
         self.assertEqual(obj, obj1)
-        XLOGGER.debug(
-            "PersonTest.test_Person_from_json_str: Creating test_data")
         test_data = Person.from_json_str(self.test_data)
         self.assertIsInstance(test_data, Person)
         self.assertEqual(obj, test_data)
-        jstr = obj.json
         XLOGGER.debug(
             "PersonTest.test_Person_from_json_str:  obj.json: %s",
             jstr)
         XLOGGER.debug(
             "PersonTest.test_Person_from_json_str: test_data: %s",
             self.test_data)
-        assert jstr == self.test_data
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json1)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json2)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json3)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json4)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json5)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json6)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json7)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json8)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json9)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json10)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json11)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json12)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json13)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json14)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json15)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json16)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json17)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json18)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json19)
-        self.assertRaises(
-            TypeError, Person.from_json_str, self.bad_json20)
+        self.assertEqual(jstr, self.test_data)
+        for bad_json in self.bad_jsons:
+            with self.subTest(bad_json=bad_json):
+                with self.assertRaises(TypeError):
+                    Person.from_json_str(bad_json)
         obj = Person.from_json_str(self.json_str2)
         self.assertIsInstance(obj, Person)
-        obj2 = Person(
-            self.id,
-            self.target_name,
-            self.recipient_type,
-            self.externally_owned_t,
-            self.first_name,
-            self.last_name,
-            self.language,
-            self.timezone,
-            self.web_login,
-            self.site)
+        obj2 = Person(*self.min_args)
         self.assertEqual(obj, obj2)
-        XLOGGER.debug(
-            "PersonTest.test_Person_from_json_str: Success")
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
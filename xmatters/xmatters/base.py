@@ -10,6 +10,7 @@ Starting point for most objects used throughout the xMatters API.
 from enum import Enum
 import json
 import logging
+from operator import attrgetter
 import sys
 from urllib.parse import quote_plus
 from requests import get
@@ -80,13 +81,11 @@ class XmattersList(list):
             ("XmattersList.from_json_obj - cls = %s, %s.base_class = %s, "
              "json_self = %s."),
             cls.__name__, cls.__name__, bcname, json_self)
-        bc_default = [
-            cls.base_class(jobj) #pylint:disable=not-callable
-            for jobj in json_self]
-        new_obj = cls(bc_default)
+        # list.__init__ drains the map, so the per-item loop runs in C
+        new_obj = cls(map(cls.base_class, json_self))
         LOGGER.debug(
             "XmattersList.from_json_obj - Created new objects: %s",
-            str(new_obj))
+            new_obj)
         return new_obj
 
     @classmethod
@@ -108,7 +107,7 @@ class XmattersList(list):
             cls.__name__, cls.__name__, bcname, json_self)
         objs = json.loads(json_self)
         LOGGER.debug(
-            "XmattersList.from_json_str - created objs: %s", str(objs))
+            "XmattersList.from_json_str - created objs: %s", objs)
         return cls.from_json_obj(objs)
 
 class XmattersJSONEncoder(json.JSONEncoder):
@@ -120,22 +119,23 @@ class XmattersJSONEncoder(json.JSONEncoder):
         LOGGER.debug(
             "XmattersJSONEncoder.default: type of obj: %s",
             type(o).__name__)
-        if issubclass(type(o), Enum):
+        if isinstance(o, Enum):
             LOGGER.debug(
                 "XmattersJSONEncoder.default: type of obj: %s, %s",
                 type(o).__name__, o.value)
             serial = o.value
             return serial
 
-        if issubclass(type(o), XmattersBase):
-            serial = dict(
-                (k, getattr(o, v))
-                for k, v in o.jsondict.items() if getattr(o,v) is not None)
+        if isinstance(o, XmattersBase):
+            serial = {}
+            for json_name, attr_name in o.jsondict.items():
+                value = getattr(o, attr_name)
+                if value is not None:
+                    serial[json_name] = value
             LOGGER.debug((
                 "XmattersJSONEncoder.default: %s is an XmattersBase subclass. "
                 "\n\t  before: %s\n\tjsondict: %s\n\t   after: %s"),
-                type(o).__name__, str(o.__dict__), str(o.jsondict),
-                str(serial))
+                type(o).__name__, o.__dict__, o.jsondict, serial)
             return serial
 
         # Let the base class default method raise the TypeError
@@ -170,6 +170,15 @@ class XmattersBase(object):
         jsondict(:obj:`dict` of :obj:`str`): Attrib names indexed by JSON names
     """
 
+    def __init_subclass__(cls, **kwargs):
+        """Builds the subclass's lookup dictionaries when it is defined
+
+        Instances that skip __init__ (pickle, copy) still find them.
+        """
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, '_arg_names'):
+            cls._build_class_dicts()
+
     @property
     def json(self) -> str:
         """Returns the JSON representation of the current object"""
@@ -234,25 +243,61 @@ class XmattersBase(object):
             LOGGER.debug('XmattersBase._setattr: value IS NOT instance of dict')
         setattr(self, name, value)
 
-    def _process_arg_names(self, names:list): #pylint:disable=no-self-use
+    @staticmethod
+    def _process_arg_names(names:list):
         """dict, dict: Builds name and req'd field dicts from tagged names"""
         arg_names = []
         req_args = []
         for arg in names:
-            arg_names.append(arg if arg[0] != '*' else arg[1:])
+            # Slicing off the '*' creates a new string; intern it so it is
+            # the same object as the keyword names used by callers.
+            arg_names.append(arg if arg[0] != '*' else sys.intern(arg[1:]))
             req_args.append(arg[0] != '*')
         return arg_names, req_args
 
-    def _build_arg_dicts(self, arg_names, req_args, attr_names):
+    @classmethod
+    def _build_arg_dicts(cls, arg_names, req_args, attr_names):
         """Creates the internal member lookup dictionaries"""
-        setattr(self, '__arg_dict', dict(zip(arg_names, attr_names)))
-        setattr(self, '__req_args_dict', dict(zip(arg_names, req_args)))
+        setattr(cls, '__arg_dict', dict(zip(arg_names, attr_names)))
+        setattr(cls, '__req_args_dict', dict(zip(arg_names, req_args)))
 
-    def _build_attr_dicts(self, attr_names, attr_types, json_names):
+    @classmethod
+    def _build_attr_dicts(cls, attr_names, attr_types, json_names):
         """Creates the internal member lookup dictionaries"""
-        setattr(self, '__attr_dict', dict(zip(attr_names, json_names)))
-        setattr(self, '__type_dict', dict(zip(attr_names, attr_types)))
-        setattr(self, '__json_dict', dict(zip(json_names, attr_names)))
+        setattr(cls, '__attr_dict', dict(zip(attr_names, json_names)))
+        setattr(cls, '__type_dict', dict(zip(attr_names, attr_types)))
+        setattr(cls, '__json_dict', dict(zip(json_names, attr_names)))
+
+    @classmethod
+    def _build_class_dicts(cls):
+        """Creates the member lookup dictionaries once per class
+
+        The dictionaries only depend on the class level name and type lists,
+        so they are built once, when the class is defined, and then shared
+        by every instance of that class.
+        """
+        if '__arg_dict' in cls.__dict__:
+            return
+        # Get arguments and attribute information from subclass
+        arg_names = cls._arg_names #pylint:disable=no-member, protected-access
+        attr_names = cls._attr_names #pylint:disable=no-member, protected-access
+        attr_types = cls._attr_types #pylint:disable=no-member, protected-access
+        json_names = cls._json_names #pylint:disable=no-member, protected-access
+        # Fixup argument names and build required arguments array
+        arg_names, req_args = cls._process_arg_names(arg_names)
+        LOGGER.debug(
+            ('XmattersBase._build_class_dicts - %s\n\targ_names: %s'
+             '\n\tattr_names: %s\n\tattr_types: %s\n\tjson_names: %s'),
+            cls.__name__, arg_names, attr_names, attr_types, json_names)
+        cls._build_attr_dicts(attr_names, attr_types, json_names)
+        # Tuple copies of the name/type lists for the per-instance loops
+        setattr(cls, '__attr_names', tuple(attr_names))
+        setattr(cls, '__attr_types', tuple(attr_types))
+        # Fetches every attribute value in one call, used by __eq__
+        setattr(cls, '__attr_getter',
+                attrgetter(*attr_names) if attr_names else None)
+        # The arg dict is the marker checked above, so it is set last
+        cls._build_arg_dicts(arg_names, req_args, attr_names)
 
     def __debug_input_args(self, args): #pylint:disable=no-self-use
         if args:
@@ -274,74 +319,78 @@ class XmattersBase(object):
         is_list = issubclass(attr_type, list) and value_type is list
         return is_xtype or is_enum or is_list or value_type is attr_type
 
-    def __process_dictionary_args(self, json_names, args):
+    def __process_dictionary_args(self, args):
+        jsondict = self.jsondict
         for dictionary in args:
-            for key in dictionary:
-                if key in json_names:
-                    if not self._is_proper_type(self.jsondict[key],
-                                                dictionary[key]):
-                        LOGGER.debug(
-                            ("XmattersBase.__process_dictionary_args TypeError:"
-                             " Initializing class %s. JSON Attribute %s "
-                             "should be a %s, but a %s was found"),
-                            self.__class__.__name__, key,
-                            str(self.typedict[self.jsondict[key]]),
-                            str(type(dictionary[key])))
-                        raise TypeError((
-                            "Initializing class %s. JSON Attribute %s "
-                            "should be a %s, but a %s was found")%(
-                            self.__class__.__name__, key,
-                            str(self.typedict[self.jsondict[key]]),
-                            str(type(dictionary[key]))))
+            for key, value in dictionary.items():
+                attr_name = jsondict.get(key)
+                if attr_name is None:
+                    continue
+                if not self._is_proper_type(attr_name, value):
                     LOGGER.debug(
-                        ("XmattersBase.__process_dictionary_args Using args as"
-                         " dict to set %s from %s to %s"),
-                        self.jsondict[key], key, dictionary[key])
-                    self._setattr(self.jsondict[key], dictionary[key])
+                        ("XmattersBase.__process_dictionary_args TypeError:"
+                         " Initializing class %s. JSON Attribute %s "
+                         "should be a %s, but a %s was found"),
+                        self.__class__.__name__, key,
+                        self.typedict[attr_name], type(value))
+                    raise TypeError((
+                        "Initializing class %s. JSON Attribute %s "
+                        "should be a %s, but a %s was found")%(
+                        self.__class__.__name__, key,
+                        str(self.typedict[attr_name]), str(type(value))))
+                LOGGER.debug(
+                    ("XmattersBase.__process_dictionary_args Using args as"
+                     " dict to set %s from %s to %s"),
+                    attr_name, key, value)
+                self._setattr(attr_name, value)
 
     def __process_positional_args(self, attr_names, attr_types, args):
-        key = 0
-        for value in args:
-            if not isinstance(value,attr_types[key]):
+        if len(args) > len(attr_names):
+            raise TypeError(
+                "Initializing class %s. Takes at most %d positional "
+                "arguments, but %d were given"%(
+                    self.__class__.__name__, len(attr_names), len(args)))
+        for key, (value, attr_name, attr_type) in enumerate(
+                zip(args, attr_names, attr_types)):
+            if not isinstance(value, attr_type):
                 LOGGER.debug(("XmattersBase.__process_positional_args TypeError"
                     ": Initializing class %s. Attribute at position %d (%s) "
                     "should be a %s, but a %s was found"),
-                    self.__class__.__name__, key, attr_names[key],
-                    str(attr_types[key]), str(type(value)))
+                    self.__class__.__name__, key, attr_name,
+                    attr_type, type(value))
                 raise TypeError((
                     "Initializing class %s. Attribute at position %d (%s) "
                     "should be a %s, but a %s was found")%(
-                    self.__class__.__name__, key, attr_names[key],
-                    str(attr_types[key]), str(type(value))))
+                    self.__class__.__name__, key, attr_name,
+                    str(attr_type), str(type(value))))
             LOGGER.debug(
                 ("XmattersBase.__process_positional_args Using positional arg "
                  "%d to set %s to %s"),
-                key, attr_names[key], str(value))
-            self._setattr(attr_names[key], value)
-            key += 1
+                key, attr_name, value)
+            self._setattr(attr_name, value)
 
     def __process_keyword_args(self, arg_names, kwargs):
-        for key in kwargs:
-            if key in arg_names:
-                attr_name = self.argdict[key]
-                if not isinstance(kwargs[key], self.typedict[attr_name]):
-                    LOGGER.debug(("XmattersBase.__process_keyword_args - "
-                        "TypeError: Initializing class %s. Keyword argument "
-                        "'%s' should be a %s, but a %s was found"),
-                        self.__class__.__name__, key,
-                        str(self.typedict[attr_name]),
-                        str(type(kwargs[key])))
-                    raise TypeError((
-                        "Initializing class %s. Keyword argument '%s' "
-                        "should be a %s, but a %s was found")%(
-                        self.__class__.__name__, key,
-                        str(self.typedict[attr_name]),
-                        str(type(kwargs[key]))))
-                LOGGER.debug(
-                    ("XmattersBase.__process_keyword_args - "
-                     "Using kwargs to set %s from %s to %s"),
-                    self.argdict[key], key, kwargs[key])
-                self._setattr(self.argdict[key], kwargs[key])
+        typedict = self.typedict
+        for key, value in kwargs.items():
+            attr_name = arg_names.get(key)
+            if attr_name is None:
+                continue
+            attr_type = typedict[attr_name]
+            if not isinstance(value, attr_type):
+                LOGGER.debug(("XmattersBase.__process_keyword_args - "
+                    "TypeError: Initializing class %s. Keyword argument "
+                    "'%s' should be a %s, but a %s was found"),
+                    self.__class__.__name__, key, attr_type, type(value))
+                raise TypeError((
+                    "Initializing class %s. Keyword argument '%s' "
+                    "should be a %s, but a %s was found")%(
+                    self.__class__.__name__, key,
+                    str(attr_type), str(type(value))))
+            LOGGER.debug(
+                ("XmattersBase.__process_keyword_args - "
+                 "Using kwargs to set %s from %s to %s"),
+                attr_name, key, value)
+            self._setattr(attr_name, value)
 
     def __confirm_required_args(self, arg_names):
         """Final check for required arguments"""
@@ -377,26 +426,17 @@ class XmattersBase(object):
                 a required argument is missing
         """
         cls = self.__class__
-        clsname = cls.__name__
         LOGGER.debug('XmattersBase.__init__ - self.__class__.__name__: %s',
-            clsname)
-        # Get arguments and attribute information from subclass
-        arg_names = cls._arg_names #pylint:disable=no-member, protected-access
-        attr_names = cls._attr_names #pylint:disable=no-member, protected-access
-        attr_types = cls._attr_types #pylint:disable=no-member, protected-access
-        json_names = cls._json_names #pylint:disable=no-member, protected-access
-        # Fixup argument names and build required arguments array
-        arg_names, req_args = self._process_arg_names(arg_names)
-        LOGGER.debug(
-            ('XmattersBase.__init__ - \n\targ_names: %s\n\tattr_names: %s'
-             '\n\tattr_types: %s\n\tjson_names: %s'),
-            str(arg_names), str(attr_names), str(attr_types), str(json_names))
+            cls.__name__)
+        # Lookup dictionaries are shared by all instances of cls; this is a
+        # no-op unless cls only got its name lists after it was defined
+        cls._build_class_dicts()
+        arg_names = self.argdict
+        attr_names = getattr(cls, '__attr_names')
+        attr_types = getattr(cls, '__attr_types')
         # Create and initialize attributes
         for name in attr_names:
             setattr(self, name, None)
-        # Create lookup dictionaries
-        self._build_arg_dicts(arg_names, req_args, attr_names)
-        self._build_attr_dicts(attr_names, attr_types, json_names)
         # debug input args
         self.__debug_input_args(args)
         # Process positional args
@@ -405,7 +445,7 @@ class XmattersBase(object):
             LOGGER.debug('XmattersBase.__init__ - numkw: %d', numkw)
         # First check if arguments come in as a dictionary
         if args and len(args) == 1 and isinstance(args[0], dict):
-            self.__process_dictionary_args(json_names, args)
+            self.__process_dictionary_args(args)
         # Next check if the args are passed in as raw values
         elif args:
             self.__process_positional_args(attr_names, attr_types, args)
@@ -415,6 +455,15 @@ class XmattersBase(object):
         self.__confirm_required_args(arg_names)
 
     def __eq__(self, other):
+        # Same class: compare all attribute values in one go
+        if type(self) is type(other):
+            getter = getattr(type(self), '__attr_getter')
+            if getter is None:
+                return True
+            try:
+                return getter(self) == getter(other)
+            except AttributeError:
+                return False
         for key, value in self.__dict__.items():
             if not key:
                 return NotImplemented
@@ -158,7 +158,7 @@ class RecipientList(XmattersList):
         new_obj = cls(bc_default)
         LOGGER.debug(
             "RecipientList.from_json_obj - Created new objects: %s",
-            str(new_obj))
+            new_obj)
         return new_obj
 
 